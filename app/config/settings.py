@@ -5,4 +5,45 @@ load_dotenv()
 class Config:
     SECRET_KEY = os.getenv('JWT_SECRET')
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # "auto" uses Postgres tsvector / SQLite FTS5 when migrated, "substring" forces ILIKE
+    HACKATHON_SEARCH_BACKEND = os.getenv('HACKATHON_SEARCH_BACKEND', 'auto')
+
+    # Seconds a worker may serve cached catalog data written by another worker
+    HACKATHON_CACHE_TTL = int(os.getenv('HACKATHON_CACHE_TTL', 30))
+
+    # Seconds between background status sweeps per worker, 0 disables the thread
+    HACKATHON_STATUS_SWEEP_INTERVAL = int(os.getenv('HACKATHON_STATUS_SWEEP_INTERVAL', 300))
+
+    # "atomic" updates interested_count in SQL per toggle, "write_behind" logs
+    # deltas and folds them every HACKATHON_INTEREST_FLUSH_INTERVAL seconds
+    HACKATHON_INTEREST_COUNTER = os.getenv('HACKATHON_INTEREST_COUNTER', 'atomic')
+    HACKATHON_INTEREST_FLUSH_INTERVAL = int(os.getenv('HACKATHON_INTEREST_FLUSH_INTERVAL', 10))
+
+    # Maintain registration_stats rows so organizer analytics is a single-row read
+    REGISTRATION_STATS_ENABLED = os.getenv('REGISTRATION_STATS_ENABLED', 'false').lower() == 'true'
+
+    # Seconds a worker may serve a user's cached registration map after
+    # another worker changed it
+    REGISTRATION_CACHE_TTL = int(os.getenv('REGISTRATION_CACHE_TTL', 30))
+
+    # Seconds a team roster stays cached; entries are keyed by roster_version,
+    # so this only bounds memory, never staleness
+    TEAM_ROSTER_CACHE_TTL = int(os.getenv('TEAM_ROSTER_CACHE_TTL', 600))
+
+    # Queue POST /register/ as tickets admitted in batches by a worker, for
+    # registration-open bursts; the drain thread runs every
+    # REGISTRATION_QUEUE_DRAIN_INTERVAL seconds (0 leaves it to the CLI)
+    REGISTRATION_QUEUE_ENABLED = os.getenv('REGISTRATION_QUEUE_ENABLED', 'false').lower() == 'true'
+    REGISTRATION_QUEUE_DRAIN_INTERVAL = int(os.getenv('REGISTRATION_QUEUE_DRAIN_INTERVAL', 2))
+    REGISTRATION_QUEUE_BATCH_SIZE = int(os.getenv('REGISTRATION_QUEUE_BATCH_SIZE', 500))
+
+    # Seconds a stored Idempotency-Key response is replayed, and seconds
+    # between purges of expired keys per worker (0 disables the thread)
+    IDEMPOTENCY_TTL = int(os.getenv('IDEMPOTENCY_TTL', 86400))
+    IDEMPOTENCY_PURGE_INTERVAL = int(os.getenv('IDEMPOTENCY_PURGE_INTERVAL', 3600))
+
+    # Seconds an Idempotency-Key stays locked by a request that never finished
+    # (crashed or killed worker) before a retry may claim it again
+    IDEMPOTENCY_LEASE = int(os.getenv('IDEMPOTENCY_LEASE', 60))
\ No newline at end of file
@@ -8,7 +8,8 @@ from app.modules.hackathons.exceptions import (
     HackathonNotFoundError,
     HackathonCreateError,
     HackathonQueryError,
-    Teamsizelimit
+    Teamsizelimit,
+    InvalidCursorError
 )
 
 from app.modules.registration.exceptions import (
@@ -21,6 +22,8 @@ from app.modules.registration.exceptions import (
     TeamMembershipError,
     TeamSizeError,
     RegistrationNotFoundError,
+    RegistrationFullError,
+    TicketNotFoundError,
 )
 
 from app.modules.teams.exceptions import *
@@ -37,6 +40,7 @@ ERROR_MAP = {
     HackathonQueryError: (500, "Failed to fetch hackathons."),
     HackathonCreateError: (500, "Failed to create hackathon."),
     Teamsizelimit:(400,"min team size should be lower"),
+    InvalidCursorError: (400, "Invalid pagination cursor."),
     PermissionError: (403, "Not allowed to perform this action."),
 
     #teams
@@ -55,6 +59,8 @@ ERROR_MAP = {
     TeamMembershipError: (403, "User not in team"),
     TeamSizeError: (400, "Invalid team size"),
     RegistrationNotFoundError: (404, "Registration not found"),
+    RegistrationFullError: (409, "Hackathon is full"),
+    TicketNotFoundError: (404, "Registration ticket not found"),
 
   
 }
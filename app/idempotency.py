@@ -0,0 +1,169 @@
+import hashlib
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import current_app, jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.modules.idempotency.models import IdempotencyKey
+
+# Derived from the stored body and mimetype on replay
+UNSTORED_HEADERS = {"content-type", "content-length"}
+
+
+def _fingerprint() -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.path}\n".encode())
+    digest.update(request.get_data())
+    return digest.hexdigest()
+
+
+def _claim(user_id: str, key: str, fingerprint: str, now: datetime):
+    """
+    Insert the in-progress row for ``key`` stamped ``now``, or return the
+    existing one when another request already holds it. Expired rows and
+    in-progress rows older than IDEMPOTENCY_LEASE (their request died)
+    are replaced.
+    """
+    record = db.session.get(IdempotencyKey, (user_id, key))
+    lease = timedelta(seconds=current_app.config["IDEMPOTENCY_LEASE"])
+
+    if record is not None and (
+        record.expires_at <= now
+        or (record.status_code is None and record.created_at <= now - lease)
+    ):
+        db.session.delete(record)
+        db.session.flush()
+        record = None
+
+    if record is not None:
+        return record
+
+    db.session.add(IdempotencyKey(
+        user_id=user_id,
+        key=key,
+        fingerprint=fingerprint,
+        created_at=now,
+        expires_at=now + timedelta(seconds=current_app.config["IDEMPOTENCY_TTL"])
+    ))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Lost the race to a concurrent retry; answer from its row
+        db.session.rollback()
+        return db.session.get(IdempotencyKey, (user_id, key))
+
+    return None
+
+
+def _release(user_id: str, key: str, claimed_at: datetime) -> None:
+    """Drop the claim of a failed request so the client can retry it."""
+    db.session.rollback()
+    # Matching claimed_at leaves alone a retry that took over an expired lease
+    IdempotencyKey.query.filter_by(user_id=user_id, key=key, created_at=claimed_at).delete()
+    db.session.commit()
+
+
+def idempotent(view):
+    """
+    Honour an ``Idempotency-Key`` header on a write endpoint: the first
+    request runs and its response is stored, retries with the same key get
+    that response back, headers included, without running the view again.
+
+    Must sit below ``jwt_required()``; keys are scoped per user. Errors the
+    app maps to a 4xx (ERROR_MAP, validation) are stored and replayed like
+    any other response. 5xx responses and unhandled errors are not stored,
+    so those can be retried, as can a key whose request stopped without
+    finishing once IDEMPOTENCY_LEASE has passed.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            return view(*args, **kwargs)
+
+        if len(key) > 255:
+            return jsonify({"message": "Idempotency-Key is too long"}), 400
+
+        user_id = str(get_jwt_identity())
+        fingerprint = _fingerprint()
+        claimed_at = datetime.utcnow()
+
+        existing = _claim(user_id, key, fingerprint, claimed_at)
+        if existing is not None:
+            if existing.fingerprint != fingerprint:
+                return jsonify({
+                    "message": "Idempotency-Key was already used for a different request"
+                }), 422
+
+            if existing.status_code is None:
+                return jsonify({
+                    "message": "A request with this Idempotency-Key is still in progress"
+                }), 409
+
+            response = current_app.response_class(
+                existing.body,
+                status=existing.status_code,
+                mimetype=existing.mimetype
+            )
+            for name, value in existing.headers or []:
+                response.headers.add(name, value)
+            response.headers["Idempotent-Replayed"] = "true"
+            return response
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception as error:
+            db.session.rollback()
+            try:
+                # Render it through the app's error handlers so it can be stored
+                response = make_response(current_app.handle_user_exception(error))
+            except Exception:
+                _release(user_id, key, claimed_at)
+                raise
+
+        if response.status_code >= 500:
+            _release(user_id, key, claimed_at)
+            return response
+
+        IdempotencyKey.query.filter_by(
+            user_id=user_id, key=key, created_at=claimed_at
+        ).update({
+            IdempotencyKey.status_code: response.status_code,
+            IdempotencyKey.body: response.get_data(),
+            IdempotencyKey.mimetype: response.mimetype,
+            IdempotencyKey.headers: [
+                [name, value] for name, value in response.headers
+                if name.lower() not in UNSTORED_HEADERS
+            ],
+        })
+        db.session.commit()
+        return response
+
+    return wrapper
+
+
+def purge_expired_keys() -> int:
+    """Delete idempotency keys past their TTL; returns the number removed."""
+    removed = IdempotencyKey.query.filter(
+        IdempotencyKey.expires_at <= datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return removed
+
+
+def start_idempotency_purger(app) -> None:
+    """Purge expired keys every IDEMPOTENCY_PURGE_INTERVAL seconds."""
+    from app.modules.hackathons.scheduler import PeriodicTask
+
+    # A DELETE by expires_at, harmless when several workers overlap
+    interval = app.config["IDEMPOTENCY_PURGE_INTERVAL"]
+    if interval > 0:
+        app.extensions["idempotency_purger"] = PeriodicTask(
+            app,
+            interval,
+            purge_expired_keys,
+            "idempotency-key-purger",
+        ).start()
@@ -21,6 +21,7 @@ def create_app():
     from app.modules.users.models import User
     from app.modules.hackathons.models import Hackathon,HackathonInterest 
     from app.modules.winners.models import Winner
+    from app.modules.idempotency.models import IdempotencyKey
     migrate.init_app(app, db)
     jwt.init_app(app)
     bcrypt.init_app(app)
@@ -29,5 +30,21 @@ def create_app():
 
     # Register exception handlers
     register_error_handlers(app)
+
+    # CLI: flask hackathons sweep-status, flask registrations drain-queue
+    from app.modules.hackathons.commands import hackathon_cli
+    from app.modules.registration.commands import registration_cli
+    app.cli.add_command(hackathon_cli)
+    app.cli.add_command(registration_cli)
+
+    # Background status sweeper, write-behind interest flusher, registration
+    # queue and idempotency key purge
+    if not app.testing:
+        from app.modules.hackathons.scheduler import start_schedulers
+        from app.modules.registration.scheduler import start_queue_worker
+        from app.idempotency import start_idempotency_purger
+        start_schedulers(app)
+        start_queue_worker(app)
+        start_idempotency_purger(app)
     
     return app
\ No newline at end of file
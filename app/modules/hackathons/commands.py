@@ -0,0 +1,30 @@
+import click
+from flask.cli import AppGroup
+
+from .services import HackathonService
+
+
+hackathon_cli = AppGroup("hackathons", help="Hackathon maintenance commands.")
+
+
+@hackathon_cli.command("sweep-status")
+def sweep_status():
+    """Move hackathons whose start/end date has passed to their new status."""
+    changed = HackathonService.sweep_statuses()
+    for status, count in changed.items():
+        click.echo(f"{status}: {count}")
+
+
+@hackathon_cli.command("flush-interest")
+def flush_interest():
+    """Fold pending write-behind interest deltas into the hackathon rows."""
+    folded = HackathonService.flush_interest_deltas()
+    click.echo(f"folded {folded} interest deltas")
+
+
+@hackathon_cli.command("reconcile-interest")
+@click.option("--chunk-size", default=500, show_default=True, help="Hackathons per transaction.")
+def reconcile_interest(chunk_size):
+    """Recompute interested_count from hackathon_interests."""
+    fixed = HackathonService.reconcile_interest_counts(chunk_size=chunk_size)
+    click.echo(f"corrected {fixed} hackathons")
@@ -13,4 +13,9 @@ class HackathonQueryError(Exception):
     pass
 
 class Teamsizelimit(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
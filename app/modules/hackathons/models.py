@@ -26,6 +26,11 @@ class Hackathon(db.Model):
 
     entry_fee = db.Column(db.Float, default=0)
     max_participants = db.Column(db.Integer, nullable=True)
+    # Seats held by registrations; only moved by conditional UPDATEs
+    seats_taken = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    # People across registrations that are not rejected (team registrations
+    # count live members)
+    participant_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     tags = db.Column(JSON, default=list)
 
@@ -41,6 +46,29 @@ class Hackathon(db.Model):
 
     organizer = db.relationship("User", backref="hackathons")
 
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        db.Index("ix_hackathons_created_at_id", "created_at", "id"),
+        # Status sweeper: boundaries that have passed
+        db.Index("ix_hackathons_start_date", "start_date"),
+        db.Index("ix_hackathons_end_date", "end_date"),
+    )
+
+class HackathonTag(db.Model):
+    """One row per (hackathon, tag); mirrors Hackathon.tags for indexed lookups."""
+    __tablename__ = "hackathon_tags"
+
+    hackathon_id = db.Column(
+        db.String,
+        db.ForeignKey("hackathons.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    tag = db.Column(db.String(100), primary_key=True)
+
+    __table_args__ = (
+        db.Index("ix_hackathon_tags_tag_hackathon_id", "tag", "hackathon_id"),
+    )
+
 class HackathonInterest(db.Model):
     __tablename__ = "hackathon_interests"
 
@@ -57,3 +85,18 @@ class HackathonInterest(db.Model):
         db.UniqueConstraint("user_id", "hackathon_id", name="uq_user_hackathon"),
     )
 
+
+
+class HackathonInterestDelta(db.Model):
+    """Append-only interest changes, folded into Hackathon.interested_count."""
+    __tablename__ = "hackathon_interest_deltas"
+
+    id = db.Column(db.Integer, primary_key=True)
+    hackathon_id = db.Column(
+        db.String,
+        db.ForeignKey("hackathons.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    delta = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
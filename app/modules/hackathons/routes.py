@@ -2,11 +2,30 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from .services import HackathonService
-from .schemas import HackathonCreateSchema,HackathonResponse, HackathonUpdateSchema,HackathonResponse
+from .schemas import (
+    HackathonCreateSchema,HackathonResponse, HackathonUpdateSchema,HACKATHON_LIST_ADAPTERS
+)
+from .search import HackathonSearch
+from .utils import encode_cursor, parse_tag_param, cached_public_response
 
 
 hackathon_bp = Blueprint("hackathons", __name__)
 
+
+def _serialize_listing(rows, view):
+    adapter = HACKATHON_LIST_ADAPTERS[view]
+    # Plain dicts validate several times faster than attribute lookups on rows
+    results = adapter.dump_python(adapter.validate_python([r._asdict() for r in rows]))
+
+    # One IN query per page instead of a /view call per card
+    interested = HackathonService.get_interested_ids(
+        get_jwt_identity(), [data["id"] for data in results]
+    )
+    for data in results:
+        data["is_interested"] = data["id"] in interested
+    return results
+
+
 @hackathon_bp.route("/",methods=['GET'])
 def check_hackathon():
     return jsonify("This is home Hackathon route")
@@ -27,43 +46,116 @@ def create_hackathon():
 
 @hackathon_bp.route("/all", methods=["GET"])
 @jwt_required(optional=True)
+@cached_public_response
 def list_hackathons():
 
     # Query params
     page = int(request.args.get("page", 1))
-    limit = int(request.args.get("limit", 10))
+    limit = max(1, int(request.args.get("limit", 10)))
 
     mode = request.args.get("mode")
     participation_type = request.args.get("participation_type")
-    tag = request.args.get("tag")
+    # ?tag=a,b matches any of the tags, add &tag_match=all to require every one
+    tag = parse_tag_param(request.args.get("tag"))
+    tag_match = "all" if request.args.get("tag_match") == "all" else "any"
     search = request.args.get("search")
+    # ?search_mode=substring keeps the old ILIKE matching
+    search_mode = request.args.get("search_mode")
     status = request.args.get("status")
 
+    # ?view=summary drops description, requirements and prizes
+    view = "summary" if request.args.get("view") == "summary" else "full"
+
+    # ?total=exact (default, cached) | estimate | none (skip counting)
+    total_mode = request.args.get("total", "exact")
+    if total_mode not in ("exact", "estimate", "none"):
+        total_mode = "exact"
+
 
    # If ?mine=true → fetch hackathons created by this user
     mine = request.args.get("mine", "false").lower() == "true"
     organizer_id = get_jwt_identity() if mine else None
 
-    hackathons, total = HackathonService.get_hackathons(
+    filters = dict(
         organizer_id=organizer_id,
-        page=page,
-        limit=limit,
         mode=mode,
         participation_type=participation_type,
         tag=tag,
         search=search,
-        status=status
+        status=status,
+        search_mode=search_mode,
+        tag_match=tag_match,
+        total_mode=total_mode,
+        view=view
+    )
+
+    # ?cursor=<token> (or an empty ?cursor= for the first page) → keyset mode
+    if "cursor" in request.args:
+        hackathons, total, next_cursor = HackathonService.get_hackathons_by_cursor(
+            cursor=request.args.get("cursor") or None,
+            limit=limit,
+            **filters
+        )
+
+        results = _serialize_listing(hackathons, view)
+
+        return jsonify({
+            "limit": limit,
+            "total": total,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+            "results": results
+        }), 200
+
+    hackathons, total, has_more = HackathonService.get_hackathons(
+        page=page,
+        limit=limit,
+        **filters
         )
 
-    results = [HackathonResponse.from_orm(h).dict() for h in hackathons]
+    results = _serialize_listing(hackathons, view)
+
+    # Let offset clients hand over to keyset pagination from here. Not for
+    # relevance-ranked search: the keyset seeks by date and would skip matches.
+    next_cursor = None
+    if has_more and not HackathonSearch.is_ranked(search, search_mode):
+        next_cursor = encode_cursor(hackathons[-1].created_at, hackathons[-1].id)
 
     return jsonify({
         "page": page,
         "limit": limit,
         "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
         "results": results
     }), 200
 
+@hackathon_bp.route("/facets", methods=["GET"])
+@jwt_required(optional=True)
+def hackathon_facets():
+    mine = request.args.get("mine", "false").lower() == "true"
+
+    try:
+        tags_limit = int(request.args.get("tags_limit", 20))
+    except ValueError:
+        return jsonify({"error": "tags_limit must be an integer"}), 400
+    # Bounded so one request cannot ask for every tag in the catalog
+    tags_limit = min(max(tags_limit, 1), 100)
+
+    facets = HackathonService.get_facets(
+        organizer_id=get_jwt_identity() if mine else None,
+        mode=request.args.get("mode"),
+        participation_type=request.args.get("participation_type"),
+        tag=parse_tag_param(request.args.get("tag")),
+        tag_match="all" if request.args.get("tag_match") == "all" else "any",
+        search=request.args.get("search"),
+        search_mode=request.args.get("search_mode"),
+        status=request.args.get("status"),
+        tags_limit=tags_limit
+    )
+
+    return jsonify(facets), 200
+
 @hackathon_bp.route("/<hackathon_id>", methods=["PUT"])
 @jwt_required()
 def update_hackathon(hackathon_id):
@@ -95,6 +187,7 @@ def delete_hackathon(hackathon_id):
 
 @hackathon_bp.route("/view/<hackathon_id>", methods=["GET"])
 @jwt_required(optional=True)
+@cached_public_response
 def get_hackathon(hackathon_id):
     user_id = get_jwt_identity()  # None if not logged in
 
@@ -0,0 +1,59 @@
+import threading
+
+from .services import HackathonService
+
+
+class PeriodicTask:
+    """
+    Daemon thread that calls ``func`` inside an app context every
+    ``interval`` seconds. Each gunicorn worker runs its own copy, so the
+    jobs scheduled here must be safe to run concurrently.
+    """
+
+    def __init__(self, app, interval: int, func, name: str):
+        self.app = app
+        self.interval = interval
+        self.func = func
+        self.name = name
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> "PeriodicTask":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        # Wait first so short-lived processes (flask db upgrade) never run a job
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    result = self.func()
+                    if result:
+                        self.app.logger.info("%s: %s", self.name, result)
+                except Exception:
+                    self.app.logger.exception("%s failed", self.name)
+
+
+def start_schedulers(app) -> None:
+    """Start the background jobs enabled in the config."""
+    # Status sweep is idempotent; overlapping runs only repeat no-op UPDATEs
+    interval = app.config["HACKATHON_STATUS_SWEEP_INTERVAL"]
+    if interval > 0:
+        app.extensions["status_sweeper"] = PeriodicTask(
+            app,
+            interval,
+            lambda: {k: v for k, v in HackathonService.sweep_statuses().items() if v},
+            "hackathon-status-sweeper",
+        ).start()
+
+    # Flushes delete exactly the delta rows they folded, so workers can overlap
+    if app.config["HACKATHON_INTEREST_COUNTER"] == "write_behind":
+        app.extensions["interest_flusher"] = PeriodicTask(
+            app,
+            app.config["HACKATHON_INTEREST_FLUSH_INTERVAL"],
+            HackathonService.flush_interest_deltas,
+            "hackathon-interest-flusher",
+        ).start()
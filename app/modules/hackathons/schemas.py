@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
@@ -32,11 +32,10 @@ class HackathonCreateSchema(BaseModel):
 
    
 
-class HackathonResponse(BaseModel):
+class HackathonSummaryResponse(BaseModel):
     id: str
     event_name: str
     organizer_id: str
-    description: Optional[str]
     location: Optional[str]
     mode: str
     participation_type: str
@@ -47,19 +46,32 @@ class HackathonResponse(BaseModel):
     end_date: Optional[datetime]
     entry_fee: float
     max_participants: Optional[int]
+    seats_taken: int = 0
+    participant_count: int = 0
     tags: List[str]
      # NEW FIELDS
     interested_count: int
     status: str
     image_url: Optional[str]
-    requirements: List[str]
-    prizes: List[str]
     created_at: datetime
 
     class Config:
         from_attributes = True  
 
 
+class HackathonResponse(HackathonSummaryResponse):
+    description: Optional[str]
+    requirements: List[str]
+    prizes: List[str]
+
+
+# Built once at import; listings validate projected rows and dump them in one call
+HACKATHON_LIST_ADAPTERS = {
+    "summary": TypeAdapter(List[HackathonSummaryResponse]),
+    "full": TypeAdapter(List[HackathonResponse]),
+}
+
+
 class HackathonUpdateSchema(BaseModel):
     event_name: Optional[str] = None
     description: Optional[str] = None
@@ -0,0 +1,148 @@
+import re
+from typing import Optional
+
+from flask import current_app
+from sqlalchemy import column, inspect, literal_column, or_, text
+from sqlalchemy.orm import Query
+
+from app.extensions import db
+from .models import Hackathon
+
+
+# Names managed outside the ORM metadata (see the search migration).
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_hackathons_search_vector"
+FTS_TABLE = "hackathons_fts"
+
+# Postgres text search config used by the generated tsvector column
+TS_CONFIG = "english"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# engine url -> backend name, so the schema is inspected once per process
+_backend_cache: dict[str, str] = {}
+
+
+class HackathonSearch:
+    """
+    Full-text search over event_name, description and location.
+
+    PostgreSQL uses a generated ``search_vector`` tsvector column with a GIN
+    index, SQLite uses the ``hackathons_fts`` FTS5 shadow table. Any other
+    database (or a schema that has not been migrated yet) falls back to the
+    original ILIKE substring search.
+    """
+
+    @staticmethod
+    def backend() -> str:
+        configured = current_app.config.get("HACKATHON_SEARCH_BACKEND", "auto")
+        if configured == "substring":
+            return "substring"
+
+        engine = db.engine
+        key = str(engine.url)
+        if key not in _backend_cache:
+            _backend_cache[key] = HackathonSearch._detect_backend(engine)
+        return _backend_cache[key]
+
+    @staticmethod
+    def _detect_backend(engine) -> str:
+        inspector = inspect(engine)
+        dialect = engine.dialect.name
+
+        if dialect == "postgresql":
+            columns = {c["name"] for c in inspector.get_columns(Hackathon.__tablename__)}
+            if SEARCH_VECTOR_COLUMN in columns:
+                return "postgresql"
+
+        if dialect == "sqlite" and inspector.has_table(FTS_TABLE):
+            return "sqlite"
+
+        return "substring"
+
+    @staticmethod
+    def _tokens(term: str) -> list[str]:
+        return _TOKEN_RE.findall(term.lower())
+
+    @staticmethod
+    def is_ranked(term: Optional[str], mode: Optional[str] = None) -> bool:
+        """Whether ``apply(..., ranked=True)`` orders ``term`` by relevance."""
+        if not term or mode == "substring":
+            return False
+        return HackathonSearch.backend() != "substring" and bool(HackathonSearch._tokens(term))
+
+    @staticmethod
+    def apply(query: Query, term: str, mode: Optional[str] = None, ranked: bool = True) -> Query:
+        """
+        Filter ``query`` by ``term``. With ``ranked`` the best matches are
+        ordered first; callers add their own tie-breaking order after it.
+        """
+        backend = "substring" if mode == "substring" else HackathonSearch.backend()
+        tokens = HackathonSearch._tokens(term)
+
+        if backend == "substring" or not tokens:
+            search_pattern = f"%{term}%"
+            return query.filter(
+                or_(
+                    Hackathon.event_name.ilike(search_pattern),
+                    Hackathon.description.ilike(search_pattern),
+                    Hackathon.location.ilike(search_pattern),
+                )
+            )
+
+        if backend == "postgresql":
+            # Prefix match every token so results update per keystroke
+            ts_query = db.func.to_tsquery(
+                TS_CONFIG, " & ".join(f"{t}:*" for t in tokens)
+            )
+            vector = literal_column(f"hackathons.{SEARCH_VECTOR_COLUMN}")
+            query = query.filter(vector.op("@@")(ts_query))
+            if ranked:
+                query = query.order_by(db.func.ts_rank(vector, ts_query).desc())
+            return query
+
+        # SQLite FTS5: bm25() is lower-is-better, weights follow column order
+        matches = (
+            text(
+                f"SELECT hackathon_id, bm25({FTS_TABLE}, 0.0, 10.0, 1.0, 4.0) AS rank "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+            )
+            .bindparams(match=" ".join(f'"{t}"*' for t in tokens))
+            .columns(column("hackathon_id"), column("rank"))
+            .subquery("fts_matches")
+        )
+        query = query.join(matches, matches.c.hackathon_id == Hackathon.id)
+        if ranked:
+            query = query.order_by(matches.c.rank.asc())
+        return query
+
+    @staticmethod
+    def index(hackathon: Hackathon) -> None:
+        """Sync one hackathon into the search index inside the current transaction."""
+        if HackathonSearch.backend() != "sqlite":
+            # The Postgres tsvector is a generated column and follows the row
+            return
+
+        HackathonSearch.remove(hackathon.id)
+        db.session.execute(
+            text(
+                f"INSERT INTO {FTS_TABLE} (hackathon_id, event_name, description, location) "
+                "VALUES (:id, :event_name, :description, :location)"
+            ),
+            {
+                "id": hackathon.id,
+                "event_name": hackathon.event_name,
+                "description": hackathon.description,
+                "location": hackathon.location,
+            },
+        )
+
+    @staticmethod
+    def remove(hackathon_id: str) -> None:
+        if HackathonSearch.backend() != "sqlite":
+            return
+
+        db.session.execute(
+            text(f"DELETE FROM {FTS_TABLE} WHERE hackathon_id = :id"),
+            {"id": hackathon_id},
+        )
@@ -1,21 +1,60 @@
+import json
 import uuid
 from app.extensions import db
 from datetime import datetime, timezone
 
-from .models import Hackathon
+from .models import Hackathon, HackathonTag
 from .exceptions import (
     HackathonNotFoundError,HackathonCreateError,HackathonQueryError,Teamsizelimit
     )
-from sqlalchemy.exc import SQLAlchemyError
-from .schemas import HackathonCreateSchema,HackathonUpdateSchema,HackathonResponse
-
-from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from flask import current_app
+from .schemas import (
+    HackathonCreateSchema,HackathonUpdateSchema,HackathonResponse,HackathonSummaryResponse
+)
+from .utils import (
+    encode_cursor, decode_cursor, normalize_tags, catalog_cache,
+    filter_signature, evict_public_responses
+)
+from .search import HackathonSearch
+
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Query
 from typing import Optional
-from app.modules.hackathons.models import HackathonInterest
+from app.modules.hackathons.models import HackathonInterest, HackathonInterestDelta
+
+FACET_FIELDS = ("mode", "participation_type", "status")
+
+# Listings select only the columns their response schema needs; "summary"
+# leaves out description, requirements and prizes.
+LISTING_COLUMNS = {
+    "summary": [getattr(Hackathon, name) for name in HackathonSummaryResponse.model_fields],
+    "full": [getattr(Hackathon, name) for name in HackathonResponse.model_fields],
+}
+
 
 class HackathonService:
 
+    @staticmethod
+    def _invalidate_catalog(*hackathon_ids) -> None:
+        """
+        Drop cached catalog data after a hackathon write, with every cached
+        listing page and the pages of the written hackathons.
+        """
+        catalog_cache.clear()
+        evict_public_responses(*hackathon_ids, listings=True)
+
+    @staticmethod
+    def _sync_tags(hackathon: Hackathon) -> None:
+        """Mirror the normalized hackathon.tags into the indexed hackathon_tags table."""
+        HackathonTag.query.filter_by(hackathon_id=hackathon.id).delete(
+            synchronize_session=False
+        )
+        db.session.add_all(
+            HackathonTag(hackathon_id=hackathon.id, tag=tag)
+            for tag in normalize_tags(hackathon.tags)
+        )
+
     @staticmethod
     def create_hackathon(data: HackathonCreateSchema) -> Hackathon:
         if data.participation_type == "Team":
@@ -40,7 +79,7 @@ class HackathonService:
 
             entry_fee=data.entry_fee,
             max_participants=data.max_participants,
-            tags=data.tags or [],
+            tags=normalize_tags(data.tags),
             status=data.status,
             image_url=data.image_url,
             requirements=data.requirements or [],
@@ -49,6 +88,9 @@ class HackathonService:
 
         try:
             db.session.add(hackathon)
+            db.session.flush()
+            HackathonService._sync_tags(hackathon)
+            HackathonSearch.index(hackathon)
             db.session.commit()
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -56,71 +98,319 @@ class HackathonService:
             # current_app.logger.error(f"Hackathon creation failed: {e}")
             raise HackathonCreateError("Database error while creating hackathon.")
 
+        HackathonService._invalidate_catalog(hackathon.id)
+
         return hackathon
     
+    @staticmethod
+    def _filtered_query(
+        mode: Optional[str] = None,
+        participation_type: Optional[str] = None,
+        tag: Optional[list[str]] = None,
+        search: Optional[str] = None,
+        organizer_id: Optional[str] = None,
+        status: Optional[str] = None,
+        search_mode: Optional[str] = None,
+        ranked: bool = False,
+        tag_match: str = "any"
+    ) -> Query:
+        query: Query = Hackathon.query
+
+        # Filters
+        if mode:
+            query = query.filter(Hackathon.mode == mode)
+
+        if participation_type:
+            query = query.filter(Hackathon.participation_type == participation_type)
+        
+        if organizer_id:
+            print("Filtering by organizer:", organizer_id)
+            query = query.filter(Hackathon.organizer_id == organizer_id)
+        
+        if status:
+            query = query.filter(Hackathon.status == status)
+
+        if tag:
+            # Served by the (tag, hackathon_id) index on hackathon_tags
+            tagged = (
+                db.session.query(HackathonTag.hackathon_id)
+                .filter(HackathonTag.tag.in_(tag))
+            )
+            if tag_match == "all" and len(tag) > 1:
+                tagged = (
+                    tagged.group_by(HackathonTag.hackathon_id)
+                    .having(db.func.count(HackathonTag.tag) == len(tag))
+                )
+            query = query.filter(Hackathon.id.in_(tagged))
+
+        if search:
+            query = HackathonSearch.apply(query, search, mode=search_mode, ranked=ranked)
+
+        return query
+
+    @staticmethod
+    def _count_total(query: Query, filters: dict, total_mode: str = "exact") -> Optional[int]:
+        """
+        Total for a listing, or None when the client asked for none.
+
+        Exact counts are cached per filter signature until the next hackathon
+        write. "estimate" reuses a cached exact count when there is one and
+        otherwise asks the Postgres planner instead of scanning.
+        """
+        if total_mode == "none":
+            return None
+
+        signature = filter_signature(**filters)
+        ttl = current_app.config["HACKATHON_CACHE_TTL"]
+
+        exact = catalog_cache.get(("count", signature))
+        if exact is not None:
+            return exact
+
+        query = query.order_by(None)
+
+        if total_mode == "estimate" and db.engine.dialect.name == "postgresql":
+            estimate = catalog_cache.get(("estimate", signature))
+            if estimate is None:
+                estimate = HackathonService._planner_estimate(query)
+                catalog_cache.set(("estimate", signature), estimate, ttl=ttl)
+            return estimate
+
+        exact = query.count()
+        catalog_cache.set(("count", signature), exact, ttl=ttl)
+        return exact
+
+    @staticmethod
+    def _planner_estimate(query: Query) -> int:
+        """Row estimate from EXPLAIN, without executing the query."""
+        compiled = query.statement.compile(
+            dialect=db.engine.dialect,
+            compile_kwargs={"render_postcompile": True}
+        )
+        plan = db.session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     @staticmethod
     def get_hackathons(
         page: int = 1,
         limit: int = 10,
         mode: Optional[str] = None,
         participation_type: Optional[str] = None,
-        tag: Optional[str] = None,
+        tag: Optional[list[str]] = None,
         search: Optional[str] = None,
         organizer_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        search_mode: Optional[str] = None,
+        tag_match: str = "any",
+        total_mode: str = "exact",
+        view: str = "full"
         
-    ) -> tuple[list[Hackathon], int]:
+    ) -> tuple[list, Optional[int], bool]:
+
+        filters = dict(
+            mode=mode,
+            participation_type=participation_type,
+            tag=tag,
+            search=search,
+            organizer_id=organizer_id,
+            status=status,
+            search_mode=search_mode,
+            tag_match=tag_match
+        )
+
+        # The extra row below only answers "has more" for a non-empty page
+        limit = max(1, limit)
 
         try:
-            query: Query = Hackathon.query
+            # Search results come back best match first
+            query = HackathonService._filtered_query(ranked=True, **filters)
+
+            # Count total before pagination
+            total = HackathonService._count_total(query, filters, total_mode)
 
-            # Filters
-            if mode:
-                query = query.filter(Hackathon.mode == mode)
+            # Apply pagination + sorting, one extra row answers "has more".
+            # Plain rows of the view's columns skip ORM hydration entirely.
+            rows = (
+                query.with_entities(*LISTING_COLUMNS[view])
+                     .order_by(Hackathon.created_at.desc(), Hackathon.id.desc())
+                     .offset((page - 1) * limit)
+                     .limit(limit + 1)
+                     .all()
+            )
 
-            if participation_type:
-                query = query.filter(Hackathon.participation_type == participation_type)
-            
-            if organizer_id:
-                print("Filtering by organizer:", organizer_id)
-                query = query.filter(Hackathon.organizer_id == organizer_id)
-            
-            if status:
-                query = query.filter(Hackathon.status == status)
+            return rows[:limit], total, len(rows) > limit
+        
+        except SQLAlchemyError as e:
+            # Optional debug logging:
+            # current_app.logger.error(f"Failed fetching hackathons: {e}")
+            raise HackathonQueryError("Database error while fetching hackathons.")
 
-            if tag:
-                query = query.filter(Hackathon.tags.like(f'%"{tag}"%'))
+    @staticmethod
+    def get_hackathons_by_cursor(
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        mode: Optional[str] = None,
+        participation_type: Optional[str] = None,
+        tag: Optional[list[str]] = None,
+        search: Optional[str] = None,
+        organizer_id: Optional[str] = None,
+        status: Optional[str] = None,
+        search_mode: Optional[str] = None,
+        tag_match: str = "any",
+        total_mode: str = "exact",
+        view: str = "full"
+    ) -> tuple[list, Optional[int], Optional[str]]:
+        """
+        Keyset pagination over (created_at, id).
+
+        Each page seeks past the last row of the previous one instead of
+        skipping rows with OFFSET, so deep pages cost the same as the first.
+        Search matches are therefore listed newest first, not by relevance.
+        """
+        filters = dict(
+            mode=mode,
+            participation_type=participation_type,
+            tag=tag,
+            search=search,
+            organizer_id=organizer_id,
+            status=status,
+            search_mode=search_mode,
+            tag_match=tag_match
+        )
+
+        # An empty page has no last row to build the next cursor from
+        limit = max(1, limit)
+
+        try:
+            query = HackathonService._filtered_query(**filters)
 
+            total = HackathonService._count_total(query, filters, total_mode)
 
-            if search:
-                search_pattern = f"%{search}%"
+            if cursor:
+                created_at, last_id = decode_cursor(cursor)
                 query = query.filter(
                     or_(
-                        Hackathon.event_name.ilike(search_pattern),
-                        Hackathon.description.ilike(search_pattern),
-                        Hackathon.location.ilike(search_pattern),
+                        Hackathon.created_at < created_at,
+                        and_(
+                            Hackathon.created_at == created_at,
+                            Hackathon.id < last_id
+                        )
                     )
                 )
 
-            # Count total before pagination
-            total = query.count()
-
-            # Apply pagination + sorting
-            hackathons = (
-                query.order_by(Hackathon.created_at.desc())
-                     .offset((page - 1) * limit)
-                     .limit(limit)
+            # Fetch one extra row to know whether another page exists
+            rows = (
+                query.with_entities(*LISTING_COLUMNS[view])
+                     .order_by(Hackathon.created_at.desc(), Hackathon.id.desc())
+                     .limit(limit + 1)
                      .all()
             )
 
-            return hackathons, total
-        
+            hackathons = rows[:limit]
+            next_cursor = None
+            if len(rows) > limit:
+                last = hackathons[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+            return hackathons, total, next_cursor
+
         except SQLAlchemyError as e:
-            # Optional debug logging:
-            # current_app.logger.error(f"Failed fetching hackathons: {e}")
             raise HackathonQueryError("Database error while fetching hackathons.")
 
 
+    @staticmethod
+    def get_facets(
+        mode: Optional[str] = None,
+        participation_type: Optional[str] = None,
+        tag: Optional[list[str]] = None,
+        search: Optional[str] = None,
+        organizer_id: Optional[str] = None,
+        status: Optional[str] = None,
+        search_mode: Optional[str] = None,
+        tag_match: str = "any",
+        tags_limit: int = 20
+    ) -> dict:
+        """
+        Counts per mode, participation_type, status and top tags.
+
+        Each facet is counted with every filter except its own, so a selected
+        value does not hide its siblings. The three enum facets come from one
+        GROUP BY over their combinations; tags need one more grouped query.
+        """
+        selected = {
+            "mode": mode,
+            "participation_type": participation_type,
+            "status": status,
+        }
+        shared = dict(
+            search=search,
+            organizer_id=organizer_id,
+            search_mode=search_mode,
+        )
+
+        key = ("facets", filter_signature(
+            tag=tag, tag_match=tag_match, tags_limit=tags_limit, **selected, **shared
+        ))
+        cached = catalog_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            columns = [getattr(Hackathon, field) for field in FACET_FIELDS]
+            combos = (
+                HackathonService._filtered_query(tag=tag, tag_match=tag_match, **shared)
+                .with_entities(*columns, db.func.count(Hackathon.id))
+                .order_by(None)
+                .group_by(*columns)
+                .all()
+            )
+
+            facets = {
+                field: {value: 0 for value in getattr(Hackathon, field).type.enums}
+                for field in FACET_FIELDS
+            }
+            total = 0
+
+            for row in combos:
+                values = dict(zip(FACET_FIELDS, row[:-1]))
+                count = row[-1]
+
+                for field in FACET_FIELDS:
+                    others_match = all(
+                        not selected[other] or values[other] == selected[other]
+                        for other in FACET_FIELDS if other != field
+                    )
+                    if others_match and values[field] is not None:
+                        facets[field][values[field]] = (
+                            facets[field].get(values[field], 0) + count
+                        )
+
+                if all(not selected[f] or values[f] == selected[f] for f in FACET_FIELDS):
+                    total += count
+
+            tagged = HackathonService._filtered_query(**selected, **shared).order_by(None)
+            tag_count = db.func.count(HackathonTag.hackathon_id)
+            top_tags = (
+                tagged.join(HackathonTag, HackathonTag.hackathon_id == Hackathon.id)
+                .with_entities(HackathonTag.tag, tag_count)
+                .group_by(HackathonTag.tag)
+                .order_by(tag_count.desc(), HackathonTag.tag)
+                .limit(tags_limit)
+                .all()
+            )
+            facets["tags"] = [{"tag": t, "count": n} for t, n in top_tags]
+
+        except SQLAlchemyError as e:
+            raise HackathonQueryError("Database error while counting hackathons.")
+
+        result = {"total": total, "facets": facets}
+        catalog_cache.set(key, result, ttl=current_app.config["HACKATHON_CACHE_TTL"])
+        return result
+
     @staticmethod
     def update_hackathon(hackathon_id: str, organizer_id: str, data: HackathonUpdateSchema):
         hackathon = Hackathon.query.get(hackathon_id)
@@ -133,15 +423,23 @@ class HackathonService:
             raise PermissionError("You cannot update someone else's hackathon.")
 
         # Apply updated fields
-        for field, value in data.dict(exclude_unset=True).items():
+        updates = data.dict(exclude_unset=True)
+        if "tags" in updates:
+            updates["tags"] = normalize_tags(updates["tags"])
+        for field, value in updates.items():
             setattr(hackathon, field, value)
 
         try:
+            if "tags" in updates:
+                HackathonService._sync_tags(hackathon)
+            HackathonSearch.index(hackathon)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise HackathonCreateError("Failed to update hackathon.")
 
+        HackathonService._invalidate_catalog(hackathon_id)
+
         return hackathon
 
     @staticmethod
@@ -156,12 +454,21 @@ class HackathonService:
             raise PermissionError("You cannot delete someone else's hackathon.")
 
         try:
+            HackathonSearch.remove(hackathon.id)
+            HackathonTag.query.filter_by(hackathon_id=hackathon.id).delete(
+                synchronize_session=False
+            )
+            HackathonInterestDelta.query.filter_by(hackathon_id=hackathon.id).delete(
+                synchronize_session=False
+            )
             db.session.delete(hackathon)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise HackathonCreateError("Failed to delete hackathon.")
 
+        HackathonService._invalidate_catalog(hackathon_id)
+
         return True
     
     @staticmethod
@@ -189,6 +496,23 @@ class HackathonService:
         return data
 
 
+    @staticmethod
+    def get_interested_ids(user_id: str | None, hackathon_ids: list[str]) -> set[str]:
+        """Which of ``hackathon_ids`` the user marked, in one IN query."""
+        if not user_id or not hackathon_ids:
+            return set()
+
+        rows = (
+            db.session.query(HackathonInterest.hackathon_id)
+            .filter(
+                HackathonInterest.user_id == user_id,
+                HackathonInterest.hackathon_id.in_(hackathon_ids)
+            )
+            .all()
+        )
+        return {hackathon_id for (hackathon_id,) in rows}
+
+
     # @staticmethod
     # def toggle_interest(hackathon_id: str, increment: bool = True):
     #     hackathon = Hackathon.query.get(hackathon_id)
@@ -209,23 +533,63 @@ class HackathonService:
 
     #     return hackathon.interested_count
 
+    @staticmethod
+    def _apply_interest_delta(hackathon_id: str, delta: int) -> None:
+        """
+        Record an interest change in the current transaction.
+
+        "atomic" mode increments hackathons.interested_count in SQL, so
+        concurrent toggles never lose updates. "write_behind" mode appends to
+        hackathon_interest_deltas instead, which keeps hot events off the
+        hackathon row; flush_interest_deltas folds the log in periodically.
+        """
+        if current_app.config["HACKATHON_INTEREST_COUNTER"] == "write_behind":
+            db.session.add(HackathonInterestDelta(hackathon_id=hackathon_id, delta=delta))
+            return
+
+        query = Hackathon.query.filter(Hackathon.id == hackathon_id)
+        if delta < 0:
+            query = query.filter(Hackathon.interested_count > 0)
+        query.update(
+            {Hackathon.interested_count: db.func.coalesce(Hackathon.interested_count, 0) + delta},
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def get_interest_count(hackathon_id: str) -> int:
+        """Folded count plus any deltas still waiting in the write-behind log."""
+        count = (
+            db.session.query(Hackathon.interested_count)
+            .filter(Hackathon.id == hackathon_id)
+            .scalar()
+        ) or 0
+
+        if current_app.config["HACKATHON_INTEREST_COUNTER"] == "write_behind":
+            count += (
+                db.session.query(db.func.coalesce(db.func.sum(HackathonInterestDelta.delta), 0))
+                .filter(HackathonInterestDelta.hackathon_id == hackathon_id)
+                .scalar()
+            )
+
+        return max(0, count)
+
     @staticmethod
     def toggle_interest(user_id: str, hackathon_id: str):
-        hackathon = Hackathon.query.get(hackathon_id)
-        if not hackathon:
+        exists = db.session.query(Hackathon.id).filter_by(id=hackathon_id).first()
+        if not exists:
             raise HackathonNotFoundError("Hackathon not found.")
 
-        interest = HackathonInterest.query.filter_by(
-            user_id=user_id,
-            hackathon_id=hackathon_id
-        ).first()
-
         try:
-            if interest:
+            # The counter only moves when a row is really deleted or inserted
+            removed = HackathonInterest.query.filter_by(
+                user_id=user_id,
+                hackathon_id=hackathon_id
+            ).delete(synchronize_session=False)
+
+            if removed:
                 # User already interested → REMOVE interest
-                db.session.delete(interest)
-                hackathon.interested_count = max(0, hackathon.interested_count - 1)
                 is_interested = False
+                HackathonService._apply_interest_delta(hackathon_id, -removed)
             else:
                 # User not interested → ADD interest
                 db.session.add(
@@ -234,19 +598,144 @@ class HackathonService:
                         hackathon_id=hackathon_id
                     )
                 )
-                hackathon.interested_count += 1
+                db.session.flush()
                 is_interested = True
+                HackathonService._apply_interest_delta(hackathon_id, 1)
 
             db.session.commit()
-            return {
-                "interested_count": hackathon.interested_count,
-                "is_interested": is_interested
-            }
+
+        except IntegrityError:
+            # A concurrent toggle by the same user inserted the row first
+            db.session.rollback()
+            is_interested = True
 
         except SQLAlchemyError:
             db.session.rollback()
             raise HackathonCreateError("Failed to update interest.")
 
+        # Counts and facets do not depend on interest, only rendered pages do
+        evict_public_responses(hackathon_id)
+        return {
+            "interested_count": HackathonService.get_interest_count(hackathon_id),
+            "is_interested": is_interested
+        }
+
+    @staticmethod
+    def flush_interest_deltas(batch_size: int = 1000) -> int:
+        """
+        Fold the write-behind log into hackathons.interested_count.
+
+        Only the delta rows that were read are deleted, so toggles committed
+        while a batch is folded are picked up by the next one.
+        """
+        folded = 0
+        touched: set[str] = set()
+
+        while True:
+            rows = (
+                db.session.query(
+                    HackathonInterestDelta.id,
+                    HackathonInterestDelta.hackathon_id,
+                    HackathonInterestDelta.delta
+                )
+                .order_by(HackathonInterestDelta.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            totals: dict[str, int] = {}
+            for _, hackathon_id, delta in rows:
+                totals[hackathon_id] = totals.get(hackathon_id, 0) + delta
+
+            try:
+                for hackathon_id, delta in totals.items():
+                    if delta:
+                        Hackathon.query.filter(Hackathon.id == hackathon_id).update(
+                            {Hackathon.interested_count: db.func.coalesce(Hackathon.interested_count, 0) + delta},
+                            synchronize_session=False
+                        )
+
+                HackathonInterestDelta.query.filter(
+                    HackathonInterestDelta.id.in_([row_id for row_id, _, _ in rows])
+                ).delete(synchronize_session=False)
+
+                db.session.commit()
+            except SQLAlchemyError:
+                db.session.rollback()
+                raise HackathonCreateError("Failed to flush interest counters.")
+
+            folded += len(rows)
+            touched.update(totals)
+
+        evict_public_responses(*touched)
+        return folded
+
+    @staticmethod
+    def reconcile_interest_counts(chunk_size: int = 500) -> int:
+        """
+        Recompute interested_count from hackathon_interests, one chunk of
+        hackathons per transaction. Returns how many hackathons were corrected.
+
+        The chunk's rows are locked first, so atomic-mode toggles wait or are
+        already committed. The drifted ids are selected, then one UPDATE
+        writes interest rows minus pending write-behind deltas, which the
+        interest rows already include. Both come from the same snapshot, and
+        deltas are left for flush_interest_deltas. A toggle committed during
+        the reconcile is never lost or counted twice. Only the cached pages
+        of corrected hackathons are evicted.
+        """
+        fixed = []
+        last_id = None
+
+        interests = (
+            select(db.func.count(HackathonInterest.id))
+            .where(HackathonInterest.hackathon_id == Hackathon.id)
+            .scalar_subquery()
+        )
+        pending = (
+            select(db.func.coalesce(db.func.sum(HackathonInterestDelta.delta), 0))
+            .where(HackathonInterestDelta.hackathon_id == Hackathon.id)
+            .scalar_subquery()
+        )
+        expected = interests - pending
+
+        while True:
+            chunk = Hackathon.query.with_entities(Hackathon.id)
+            if last_id is not None:
+                chunk = chunk.filter(Hackathon.id > last_id)
+            chunk = chunk.order_by(Hackathon.id).limit(chunk_size).with_for_update().all()
+            if not chunk:
+                db.session.rollback()
+                break
+
+            ids = [hackathon_id for (hackathon_id,) in chunk]
+
+            drifted = db.func.coalesce(Hackathon.interested_count, -1) != expected
+
+            try:
+                stale = [
+                    hackathon_id
+                    for (hackathon_id,) in Hackathon.query.with_entities(Hackathon.id)
+                    .filter(Hackathon.id.in_(ids), drifted)
+                ]
+                if stale:
+                    Hackathon.query.filter(Hackathon.id.in_(stale), drifted).update(
+                        {Hackathon.interested_count: expected},
+                        synchronize_session=False
+                    )
+                db.session.commit()
+            except SQLAlchemyError:
+                db.session.rollback()
+                raise HackathonCreateError("Failed to reconcile interest counts.")
+
+            fixed.extend(stale)
+            last_id = ids[-1]
+
+        evict_public_responses(*fixed)
+        return len(fixed)
+
     @staticmethod
     def refresh_hackathon_status(hackathon_id: str) -> Hackathon:
         hackathon = Hackathon.query.get(hackathon_id)
@@ -282,4 +771,45 @@ class HackathonService:
                 db.session.rollback()
                 raise HackathonCreateError("Failed to update hackathon status.")
 
-        return hackathon
\ No newline at end of file
+        return hackathon
+
+    @staticmethod
+    def sweep_statuses(now: Optional[datetime] = None) -> dict[str, int]:
+        """
+        Move every hackathon whose start/end boundary has passed to its
+        current status: per status, one SELECT of the ids to move (served by
+        the start_date / end_date indexes) and one UPDATE of those ids. Same
+        rules as refresh_hackathon_status.
+        """
+        now = now or datetime.utcnow()
+        dated = and_(Hackathon.start_date.isnot(None), Hackathon.end_date.isnot(None))
+
+        transitions = {
+            "completed": Hackathon.end_date < now,
+            "ongoing": and_(Hackathon.start_date <= now, Hackathon.end_date >= now),
+            "upcoming": Hackathon.start_date > now,
+        }
+
+        moved = {}
+        try:
+            for status, condition in transitions.items():
+                moved[status] = [
+                    hackathon_id
+                    for (hackathon_id,) in Hackathon.query.with_entities(Hackathon.id)
+                    .filter(dated, condition, Hackathon.status != status)
+                ]
+                if moved[status]:
+                    Hackathon.query.filter(Hackathon.id.in_(moved[status])).update(
+                        {Hackathon.status: status}, synchronize_session=False
+                    )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            raise HackathonCreateError("Failed to update hackathon statuses.")
+
+        # Only the moved events' pages and the listings go stale
+        moved_ids = [hackathon_id for ids in moved.values() for hackathon_id in ids]
+        if moved_ids:
+            HackathonService._invalidate_catalog(*moved_ids)
+
+        return {status: len(ids) for status, ids in moved.items()}
\ No newline at end of file
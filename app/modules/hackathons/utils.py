@@ -0,0 +1,140 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from functools import wraps
+
+from flask import current_app, make_response, request
+from flask_jwt_extended import get_jwt_identity
+
+from app.cache import TTLCache
+from .exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, hackathon_id: str) -> str:
+    """Build an opaque keyset cursor from the last row of a page."""
+    raw = json.dumps(
+        {"c": created_at.isoformat(), "i": hackathon_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Return the (created_at, id) pair stored in a cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["c"]), str(data["i"])
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise InvalidCursorError("Invalid pagination cursor.")
+
+
+def normalize_tags(tags) -> list[str]:
+    """Strip, drop empties and de-duplicate tags while keeping their order."""
+    seen = []
+    for tag in tags or []:
+        tag = str(tag).strip()[:100]
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def parse_tag_param(value: str | None) -> list[str]:
+    """Split a ``?tag=a,b`` query value into normalized tags."""
+    if not value:
+        return []
+    return normalize_tags(value.split(","))
+
+
+# Derived catalog data (facets, counts) for the current process; cleared on
+# every hackathon write by HackathonService.
+catalog_cache = TTLCache(maxsize=2048)
+
+# Rendered anonymous responses of the public read routes, tagged with the
+# hackathon ids they show; counter changes evict by tag.
+response_cache = TTLCache(maxsize=2048)
+
+
+def filter_signature(**filters) -> tuple:
+    """Normalize listing filters into a hashable cache key."""
+    signature = []
+    for name, value in sorted(filters.items()):
+        if value is None or value == "" or value == []:
+            continue
+        if isinstance(value, list):
+            value = tuple(sorted(value))
+        elif name == "search":
+            value = " ".join(value.lower().split())
+        signature.append((name, value))
+    return tuple(signature)
+
+
+# Tag of every cached listing page, whatever it shows; never a hackathon id
+LISTING_TAG = "listing"
+
+
+def _shown_hackathons(body: bytes, view_kwargs: dict) -> frozenset:
+    """Ids of the hackathons a response shows: its own, or every listed one."""
+    if "hackathon_id" in view_kwargs:
+        return frozenset([view_kwargs["hackathon_id"]])
+
+    payload = json.loads(body)
+    return frozenset([LISTING_TAG, *(item["id"] for item in payload.get("results", []))])
+
+
+def evict_public_responses(*hackathon_ids, listings: bool = False) -> None:
+    """
+    Drop the cached anonymous responses that show any of ``hackathon_ids``,
+    after a committed change to their counters. Other pages stay cached.
+    Writes that can move a hackathon in or out of a listing pass
+    ``listings=True`` to drop every listing page as well.
+    """
+    targets = set(hackathon_ids)
+    if listings:
+        targets.add(LISTING_TAG)
+    if targets:
+        response_cache.delete_where(lambda key, entry: not targets.isdisjoint(entry[3]))
+
+
+def cached_public_response(view):
+    """
+    Serve anonymous GETs from ``response_cache`` and answer every 200 with a
+    strong ETag, replying 304 when ``If-None-Match`` still matches.
+
+    Must sit below ``jwt_required(optional=True)`` so the identity is known.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        anonymous = get_jwt_identity() is None
+        key = (
+            "response",
+            request.path,
+            tuple(sorted(request.args.items(multi=True))),
+        )
+
+        cached = response_cache.get(key) if anonymous else None
+        if cached is None:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            body = response.get_data()
+            etag = hashlib.sha256(body).hexdigest()
+            if anonymous:
+                response_cache.set(
+                    key, (body, response.mimetype, etag, _shown_hackathons(body, kwargs)),
+                    ttl=current_app.config["HACKATHON_CACHE_TTL"]
+                )
+        else:
+            body, mimetype, etag, _ = cached
+            response = current_app.response_class(body, mimetype=mimetype)
+
+        response.set_etag(etag)
+        # Clients may store it but must revalidate; the body depends on the token
+        response.headers["Cache-Control"] = "no-cache"
+        response.vary.add("Authorization")
+        return response.make_conditional(request)
+
+    return wrapper
@@ -0,0 +1,30 @@
+from datetime import datetime
+from app.extensions import db
+from sqlalchemy import JSON
+
+
+class IdempotencyKey(db.Model):
+    """
+    Stored response for a write replayed with the same ``Idempotency-Key``.
+    ``status_code`` stays NULL while the first request is still running.
+    """
+    __tablename__ = "idempotency_keys"
+
+    user_id = db.Column(db.String, primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+
+    # sha256 of method, path and body; a reused key must match it
+    fingerprint = db.Column(db.String(64), nullable=False)
+
+    status_code = db.Column(db.Integer, nullable=True)
+    body = db.Column(db.LargeBinary, nullable=True)
+    mimetype = db.Column(db.String(100), nullable=True)
+    # [name, value] pairs the view set, e.g. Location
+    headers = db.Column(JSON, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
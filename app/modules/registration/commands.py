@@ -0,0 +1,42 @@
+import click
+from flask.cli import AppGroup
+
+from app.modules.teams.services import TeamService
+from .services import RegistrationService
+
+
+registration_cli = AppGroup("registrations", help="Registration maintenance commands.")
+
+
+@registration_cli.command("drain-queue")
+@click.option("--batch-size", default=500, show_default=True, help="Tickets per transaction.")
+@click.option("--until-empty", is_flag=True, help="Keep draining until no queued tickets remain.")
+def drain_queue(batch_size, until_empty):
+    """Admit queued registration tickets, waitlisting overflow."""
+    totals = {}
+    while True:
+        outcome = RegistrationService.drain_queue(batch_size=batch_size)
+        for status, count in outcome.items():
+            totals[status] = totals.get(status, 0) + count
+        if not until_empty or not outcome:
+            break
+
+    for status, count in totals.items():
+        click.echo(f"{status}: {count}")
+
+
+@registration_cli.command("reconcile-counts")
+@click.option("--chunk-size", default=500, show_default=True, help="Rows per transaction.")
+@click.option("--check", is_flag=True, help="Only report drift, change nothing.")
+def reconcile_counts(chunk_size, check):
+    """Check team member_count and hackathon participant_count for drift."""
+    # Participant totals are built from member_count, so teams go first
+    teams = TeamService.reconcile_member_counts(chunk_size=chunk_size, fix=not check)
+    hackathons = RegistrationService.reconcile_participant_counts(chunk_size=chunk_size, fix=not check)
+
+    for label, drift in (("team", teams), ("hackathon", hackathons)):
+        for row_id, (stored, actual) in drift.items():
+            click.echo(f"{label} {row_id}: stored {stored}, actual {actual}")
+
+    verb = "found" if check else "corrected"
+    click.echo(f"{verb} {len(teams)} teams, {len(hackathons)} hackathons")
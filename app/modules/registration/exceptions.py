@@ -37,3 +37,11 @@ class TeamSizeError(RegistrationError):
 
 class RegistrationNotFoundError(RegistrationError):
     pass
+
+
+class RegistrationFullError(RegistrationError):
+    pass
+
+
+class TicketNotFoundError(RegistrationError):
+    pass
@@ -32,10 +32,13 @@ class HackathonRegistration(db.Model):
 
     registered_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Seats reserved on hackathons.seats_taken (1, or the team size)
+    seats = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+
     # relationships
     hackathon = db.relationship("Hackathon", backref="registrations")
     
-    user = db.relationship("User", lazy="joined",backref="individual_registrations")
+    user = db.relationship("User", backref="individual_registrations")
     team = db.relationship("HackathonTeam", backref="team_registrations")
 
     __table_args__ = (
@@ -46,4 +49,70 @@ class HackathonRegistration(db.Model):
         db.UniqueConstraint(
             "hackathon_id", "team_id", name="uq_hackathon_team_registration"
         ),
+        # Organizer listing: keyset over (registered_at, id) per hackathon
+        db.Index(
+            "ix_registrations_hackathon_registered_at",
+            "hackathon_id", "registered_at", "id"
+        ),
+    )
+
+
+class RegistrationStats(db.Model):
+    """
+    Per-hackathon registration counters maintained by RegistrationService.
+    People are counted by hackathons.participant_count, which also follows
+    roster changes.
+    """
+    __tablename__ = "registration_stats"
+
+    hackathon_id = db.Column(
+        db.String,
+        db.ForeignKey("hackathons.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    total_registrations = db.Column(db.Integer, nullable=False, default=0)
+    pending = db.Column(db.Integer, nullable=False, default=0)
+    approved = db.Column(db.Integer, nullable=False, default=0)
+    rejected = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RegistrationTicket(db.Model):
+    """
+    Queued registration request. POST /register/ writes one of these when
+    REGISTRATION_QUEUE_ENABLED is set and the queue worker admits them in
+    batches, waitlisting whatever no longer fits max_participants.
+    """
+    __tablename__ = "registration_tickets"
+
+    id = db.Column(db.String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    hackathon_id = db.Column(
+        db.String,
+        db.ForeignKey("hackathons.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    user_id = db.Column(db.String, db.ForeignKey("users.id"), nullable=False)
+    team_id = db.Column(db.String, db.ForeignKey("hackathon_teams.id"), nullable=True)
+
+    status = db.Column(
+        db.Enum("queued", "registered", "waitlisted", "failed", name="registration_ticket_status"),
+        nullable=False,
+        default="queued"
+    )
+
+    # Set once admitted; the reason when failed
+    registration_id = db.Column(db.String, nullable=True)
+    message = db.Column(db.String(255), nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # Worker claims the oldest queued tickets; waitlist positions count by hackathon
+        db.Index("ix_registration_tickets_status_created_at", "status", "created_at"),
+        db.Index("ix_registration_tickets_hackathon_status", "hackathon_id", "status", "created_at"),
     )
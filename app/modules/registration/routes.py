@@ -1,10 +1,17 @@
-from flask import Blueprint, request, jsonify
+import csv
+import io
+import json
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context, url_for
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.idempotency import idempotent
 from pydantic import ValidationError
 
 from app.modules.registration.schemas import (
     RegistrationCreateSchema,
-    RegistrationResponseSchema
+    RegistrationResponseSchema,
+    RegistrationTicketResponseSchema,
+    RegistrationBulkStatusSchema
 )
 from app.modules.registration.services import RegistrationService
 
@@ -16,10 +23,23 @@ registration_bp = Blueprint(
 
 @registration_bp.route("/", methods=["POST"])
 @jwt_required()
+@idempotent
 def register():
     payload = RegistrationCreateSchema(**request.json)
     user_id = get_jwt_identity()
 
+    # Burst mode: hand back a ticket and let the queue worker admit it
+    if current_app.config["REGISTRATION_QUEUE_ENABLED"]:
+        ticket = RegistrationService.enqueue(
+            hackathon_id=payload.hackathon_id,
+            user_id=user_id,
+            team_id=payload.team_id
+        )
+        response = RegistrationTicketResponseSchema.model_validate(ticket)
+        # Where to poll for the outcome
+        location = url_for(".ticket_status", ticket_id=ticket.id)
+        return jsonify(response.model_dump()), 202, {"Location": location}
+
     registration = RegistrationService.register(
         hackathon_id=payload.hackathon_id,
         user_id=user_id,
@@ -29,6 +49,13 @@ def register():
     response = RegistrationResponseSchema.from_orm(registration)
     return jsonify(response.dict()), 201
 
+@registration_bp.route("/tickets/<ticket_id>", methods=["GET"])
+@jwt_required()
+def ticket_status(ticket_id):
+    ticket = RegistrationService.get_ticket(ticket_id, get_jwt_identity())
+    response = RegistrationTicketResponseSchema.model_validate(ticket)
+    return jsonify(response.model_dump()), 200
+
 @registration_bp.route("/<registration_id>/status", methods=["PATCH"])
 @jwt_required()
 def update_status(registration_id):
@@ -45,6 +72,24 @@ def update_status(registration_id):
     response = RegistrationResponseSchema.from_orm(registration)
     return jsonify(response.dict()), 200
 
+@registration_bp.route("/status", methods=["PATCH"])
+@jwt_required()
+def bulk_update_status():
+    payload = RegistrationBulkStatusSchema(**request.json)
+
+    if payload.ids is None and not payload.hackathon_id:
+        return jsonify({"error": "Provide ids or hackathon_id"}), 400
+
+    result = RegistrationService.bulk_update_status(
+        organizer_id=get_jwt_identity(),
+        status=payload.status,
+        ids=payload.ids,
+        hackathon_id=payload.hackathon_id,
+        current_status=payload.current_status
+    )
+
+    return jsonify(result), 200
+
 @registration_bp.route("/me", methods=["GET"])
 @jwt_required()
 def my_registrations():
@@ -52,7 +97,7 @@ def my_registrations():
     registrations = RegistrationService.get_user_registrations(user_id)
 
     response = [
-        RegistrationResponseSchema.from_orm(r).dict()
+        RegistrationResponseSchema(**r).dict()
         for r in registrations
     ]
 
@@ -73,14 +118,82 @@ def team_registrations(team_id):
 @registration_bp.route("/hackathon/<hackathon_id>", methods=["GET"])
 @jwt_required()
 def hackathon_registrations(hackathon_id):
-    registrations = RegistrationService.get_hackathon_registrations(hackathon_id)
+    # ?limit= or ?cursor= opts into pages; without them the endpoint keeps
+    # answering with the bare array of every registration
+    paged = "limit" in request.args or "cursor" in request.args
+    limit = max(1, min(int(request.args.get("limit", 100)), 500)) if paged else None
+
+    registrations, next_cursor = RegistrationService.get_hackathon_registrations(
+        hackathon_id,
+        limit=limit,
+        cursor=request.args.get("cursor") or None,
+        status=request.args.get("status")
+    )
 
     response = [
         RegistrationResponseSchema.from_orm(r).dict()
         for r in registrations
     ]
 
-    return jsonify(response), 200
+    if not paged:
+        return jsonify(response), 200
+
+    return jsonify({
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "results": response
+    }), 200
+
+EXPORT_FIELDS = (
+    "registration_id", "status", "registered_at", "team_id", "team_name",
+    "role", "user_id", "name", "email",
+)
+
+
+def _csv_lines(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    yield buffer.getvalue()
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+@registration_bp.route("/hackathon/<hackathon_id>/export", methods=["GET"])
+@jwt_required()
+def export_registrations(hackathon_id):
+    fmt = request.args.get("format", "csv")
+    if fmt not in ("csv", "ndjson"):
+        return jsonify({"error": "Invalid format"}), 400
+
+    rows = RegistrationService.export_registrations(
+        hackathon_id,
+        organizer_id=get_jwt_identity(),
+        status=request.args.get("status")
+    )
+
+    if fmt == "csv":
+        body, mimetype = _csv_lines(rows), "text/csv"
+    else:
+        body, mimetype = _ndjson_lines(rows), "application/x-ndjson"
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="registrations-{hackathon_id}.{fmt}"'
+        }
+    )
 
 @registration_bp.route("/check/<hackathon_id>", methods=["GET"])
 @jwt_required()
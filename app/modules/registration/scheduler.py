@@ -0,0 +1,17 @@
+from app.modules.hackathons.scheduler import PeriodicTask
+
+from .services import RegistrationService
+
+
+def start_queue_worker(app) -> None:
+    """Drain the registration queue in-process when queued mode is on."""
+    # Batches claim tickets with SKIP LOCKED, so every worker may drain
+    interval = app.config["REGISTRATION_QUEUE_DRAIN_INTERVAL"]
+    if app.config["REGISTRATION_QUEUE_ENABLED"] and interval > 0:
+        batch_size = app.config["REGISTRATION_QUEUE_BATCH_SIZE"]
+        app.extensions["registration_queue"] = PeriodicTask(
+            app,
+            interval,
+            lambda: RegistrationService.drain_queue(batch_size=batch_size),
+            "registration-queue-worker",
+        ).start()
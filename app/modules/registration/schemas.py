@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 from enum import Enum
 
@@ -45,3 +45,30 @@ class RegistrationResponseSchema(BaseModel):
     team: Optional[TeamResponseSchema] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RegistrationTicketResponseSchema(BaseModel):
+    id: str
+    hackathon_id: str
+    team_id: Optional[str] = None
+    status: str
+    registration_id: Optional[str] = None
+    message: Optional[str] = None
+    created_at: datetime
+    processed_at: Optional[datetime] = None
+
+    # Place in the queue / hackathon waitlist, while the ticket is in one
+    position: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+
+class RegistrationBulkStatusSchema(BaseModel):
+    status: Literal["approved", "rejected"]
+
+    # Either explicit ids, or every registration of hackathon_id
+    # (optionally only those currently in current_status)
+    ids: Optional[List[str]] = None
+    hackathon_id: Optional[str] = None
+    current_status: Optional[Literal["pending", "approved", "rejected"]] = None
@@ -1,10 +1,19 @@
+import uuid
 from datetime import datetime
+from flask import current_app
+from sqlalchemy import and_, case, insert, or_
+from sqlalchemy.orm import aliased
+from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 
 from app.modules.hackathons.models import Hackathon
-from app.modules.registration.model import HackathonRegistration
-from app.modules.teams.models import HackathonTeam
+from app.modules.users.models import User
+from app.modules.hackathons.utils import encode_cursor, decode_cursor, evict_public_responses
+from app.modules.registration.model import HackathonRegistration, RegistrationStats, RegistrationTicket
+from app.modules.teams.models import HackathonTeam, HackathonTeamMember
 from app.modules.registration.schemas import RegistrationResponseSchema
+from app.modules.registration.utils import registration_cache, registration_load_options
+from app.modules.teams.utils import get_team, get_rosters
 from app.modules.registration.exceptions import (
     HackathonNotFoundError,
     RegistrationClosedError,
@@ -15,17 +24,24 @@ from app.modules.registration.exceptions import (
     TeamMembershipError,
     TeamSizeError,
     RegistrationNotFoundError,
+    RegistrationFullError,
+    TicketNotFoundError,
+    RegistrationError,
 )
 
 
+# registration.status values that have their own registration_stats column
+STATUS_COLUMNS = ("pending", "approved", "rejected")
+
+
 class RegistrationService:
 
     @staticmethod
-    def register(hackathon_id, user_id, team_id=None):
-        hackathon = Hackathon.query.get(hackathon_id)
-        if not hackathon:
-            raise HackathonNotFoundError("Hackathon not found")
-
+    def _prepare_registration(hackathon, user_id, team_id=None, team=None, is_member=False):
+        """
+        Apply the registration rules that need no further queries. Shared by
+        register() and the queue worker; returns (registration, seats).
+        """
         # Deadline enforcement
         if hackathon.deadline and hackathon.deadline < datetime.utcnow():
             raise RegistrationClosedError("Registration deadline has passed")
@@ -37,36 +53,27 @@ class RegistrationService:
                     "This hackathon allows individual participation only"
                 )
 
-            existing = HackathonRegistration.query.filter_by(
-                hackathon_id=hackathon_id,
-                user_id=user_id
-            ).first()
-
-            if existing:
-                raise DuplicateRegistrationError("User already registered")
-
             registration = HackathonRegistration(
-                hackathon_id=hackathon_id,
-                user_id=user_id
+                hackathon_id=hackathon.id,
+                user_id=user_id,
+                seats=1
             )
+            return registration, 1
 
         # ───────────── Team Registration ─────────────
-        elif hackathon.participation_type == "team":
+        if hackathon.participation_type == "team":
             if not team_id:
                 raise TeamRequiredError("Team registration required")
 
-            team = HackathonTeam.query.get(team_id)
             if not team:
                 raise TeamNotFoundError("Team not found")
 
-            member_ids = [member.member_id for member in team.members]
-
-            if int(user_id) not in member_ids:
+            if not is_member:
                 raise TeamMembershipError(
                     "User is not a member of this team"
                 )
 
-            team_size = len(team.members)
+            team_size = team.member_count
 
             if hackathon.min_team_size and team_size < hackathon.min_team_size:
                 raise TeamSizeError("Team size is below minimum requirement")
@@ -74,6 +81,38 @@ class RegistrationService:
             if hackathon.max_team_size and team_size > hackathon.max_team_size:
                 raise TeamSizeError("Team size exceeds maximum limit")
 
+            registration = HackathonRegistration(
+                hackathon_id=hackathon.id,
+                team_id=team_id,
+                seats=team_size
+            )
+            return registration, team_size
+
+        raise InvalidParticipationTypeError("Invalid participation type")
+
+    @staticmethod
+    def register(hackathon_id, user_id, team_id=None):
+        hackathon = Hackathon.query.get(hackathon_id)
+        if not hackathon:
+            raise HackathonNotFoundError("Hackathon not found")
+
+        team = None
+        is_member = False
+        if hackathon.participation_type == "team" and team_id:
+            # Size comes from member_count, so the roster itself is never loaded
+            team = get_team(team_id)
+            is_member = db.session.query(
+                HackathonTeamMember.query.filter_by(
+                    hackathon_team_id=team_id,
+                    member_id=int(user_id)
+                ).exists()
+            ).scalar()
+
+        registration, participants = RegistrationService._prepare_registration(
+            hackathon, user_id, team_id, team, is_member
+        )
+
+        if registration.team_id:
             existing = HackathonRegistration.query.filter_by(
                 hackathon_id=hackathon_id,
                 team_id=team_id
@@ -81,19 +120,336 @@ class RegistrationService:
 
             if existing:
                 raise DuplicateRegistrationError("Team already registered")
-
-            registration = HackathonRegistration(
+        else:
+            existing = HackathonRegistration.query.filter_by(
                 hackathon_id=hackathon_id,
-                team_id=team_id
-            )
+                user_id=user_id
+            ).first()
 
-        else:
-            raise InvalidParticipationTypeError("Invalid participation type")
+            if existing:
+                raise DuplicateRegistrationError("User already registered")
 
+        RegistrationService._reserve_seats(hackathon_id, participants, participants=participants)
+
+        # Counters first, so a freshly seeded row does not include this one
+        RegistrationService._bump_stats(
+            hackathon_id,
+            total_registrations=1,
+            pending=1
+        )
         db.session.add(registration)
-        db.session.commit()
+
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Lost a race with an identical registration; its seats stay taken once
+            db.session.rollback()
+            raise DuplicateRegistrationError("Already registered")
+
+        # Cached public hackathon pages show seats_taken and participant_count
+        evict_public_responses(hackathon_id)
+
+        if registration.team_id:
+            RegistrationService._forget_users(team_ids=[registration.team_id])
+        else:
+            RegistrationService._forget_users(user_ids=[user_id])
+
         return registration
 
+    @staticmethod
+    def _forget_users(user_ids=(), team_ids=()):
+        """
+        Drop the cached registration maps of ``user_ids`` and of every
+        current member of ``team_ids``. Call after the write has committed.
+        """
+        keys = {str(user_id) for user_id in user_ids if user_id is not None}
+
+        if team_ids:
+            keys.update(
+                str(member_id)
+                for (member_id,) in db.session.query(HackathonTeamMember.member_id)
+                .filter(HackathonTeamMember.hackathon_team_id.in_(team_ids))
+            )
+
+        for key in keys:
+            registration_cache.delete(key)
+
+    @staticmethod
+    def _reserve_seats(hackathon_id, seats, participants=0):
+        """
+        Take ``seats`` inside the registration transaction with one
+        conditional UPDATE, so bursts can never oversell max_participants.
+        New registrations add their ``participants`` in the same statement.
+        """
+        values = {Hackathon.seats_taken: Hackathon.seats_taken + seats}
+        if participants:
+            values[Hackathon.participant_count] = Hackathon.participant_count + participants
+
+        reserved = (
+            Hackathon.query
+            .filter(
+                Hackathon.id == hackathon_id,
+                or_(
+                    Hackathon.max_participants.is_(None),
+                    Hackathon.seats_taken + seats <= Hackathon.max_participants
+                )
+            )
+            .update(values, synchronize_session=False)
+        )
+
+        if not reserved:
+            db.session.rollback()
+            raise RegistrationFullError("No seats left for this hackathon")
+
+    @staticmethod
+    def _release_seats(hackathon_id, seats):
+        """Free a rejected registration's seats; its people stop counting too."""
+        Hackathon.query.filter(Hackathon.id == hackathon_id).update(
+            {
+                Hackathon.seats_taken: Hackathon.seats_taken - seats,
+                Hackathon.participant_count: Hackathon.participant_count - seats,
+            },
+            synchronize_session=False
+        )
+
+    # ───────────── Admission Queue ─────────────
+    @staticmethod
+    def enqueue(hackathon_id, user_id, team_id=None):
+        """
+        Record a registration request as a queued ticket. Only the foreign
+        keys are checked here; the rules are applied by the worker, so a
+        burst costs a lookup and one INSERT per request.
+        """
+        if not db.session.query(Hackathon.id).filter(Hackathon.id == hackathon_id).first():
+            raise HackathonNotFoundError("Hackathon not found")
+
+        if team_id and not db.session.query(HackathonTeam.id).filter(HackathonTeam.id == team_id).first():
+            raise TeamNotFoundError("Team not found")
+
+        ticket = RegistrationTicket(
+            hackathon_id=hackathon_id,
+            user_id=user_id,
+            team_id=team_id
+        )
+        db.session.add(ticket)
+
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # The hackathon or team was deleted since the lookups above
+            db.session.rollback()
+            if team_id:
+                raise TeamNotFoundError("Team not found")
+            raise HackathonNotFoundError("Hackathon not found")
+        return ticket
+
+    @staticmethod
+    def get_ticket(ticket_id, user_id):
+        ticket = RegistrationTicket.query.filter_by(id=ticket_id, user_id=user_id).first()
+        if not ticket:
+            raise TicketNotFoundError("Registration ticket not found")
+
+        data = {
+            "id": ticket.id,
+            "hackathon_id": ticket.hackathon_id,
+            "team_id": ticket.team_id,
+            "status": ticket.status,
+            "registration_id": ticket.registration_id,
+            "message": ticket.message,
+            "created_at": ticket.created_at,
+            "processed_at": ticket.processed_at,
+            "position": None,
+        }
+
+        # 1-based place in the hackathon's queue or waitlist
+        if ticket.status in ("queued", "waitlisted"):
+            ahead = RegistrationTicket.query.filter(
+                RegistrationTicket.status == ticket.status,
+                RegistrationTicket.created_at < ticket.created_at
+            )
+            if ticket.status == "waitlisted":
+                ahead = ahead.filter(RegistrationTicket.hackathon_id == ticket.hackathon_id)
+            data["position"] = ahead.count() + 1
+
+        return data
+
+    @staticmethod
+    def drain_queue(batch_size=500):
+        """
+        Admit up to ``batch_size`` queued tickets in one transaction. Rows
+        are claimed with SKIP LOCKED where supported, so several workers can
+        drain concurrently. Returns the number of tickets per outcome.
+        """
+        tickets = (
+            RegistrationTicket.query
+            .filter(RegistrationTicket.status == "queued")
+            .order_by(RegistrationTicket.created_at, RegistrationTicket.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not tickets:
+            return {}
+
+        by_hackathon = {}
+        for ticket in tickets:
+            by_hackathon.setdefault(ticket.hackathon_id, []).append(ticket)
+
+        for hackathon_id, group in by_hackathon.items():
+            RegistrationService._admit_tickets(hackathon_id, group)
+
+        outcome = {}
+        for ticket in tickets:
+            outcome[ticket.status] = outcome.get(ticket.status, 0) + 1
+
+        db.session.commit()
+
+        if outcome.get("registered"):
+            registration_cache.clear()
+            evict_public_responses(*by_hackathon)
+        return outcome
+
+    @staticmethod
+    def _admit_tickets(hackathon_id, tickets):
+        """
+        Admit one hackathon's share of a batch: teams and existing
+        registrations are loaded with one query each, registrations go in
+        with one bulk INSERT and seats are taken with one UPDATE.
+        """
+        now = datetime.utcnow()
+        for ticket in tickets:
+            ticket.processed_at = now
+
+        hackathon = (
+            Hackathon.query
+            .filter(Hackathon.id == hackathon_id)
+            .with_for_update()
+            .first()
+        )
+        if not hackathon:
+            for ticket in tickets:
+                ticket.status = "failed"
+                ticket.message = "Hackathon not found"
+            return
+
+        team_ids = {t.team_id for t in tickets if t.team_id}
+        teams = {}
+        memberships = set()
+        if team_ids and hackathon.participation_type == "team":
+            teams = {
+                team.id: team
+                for team in HackathonTeam.query.filter(HackathonTeam.id.in_(team_ids))
+            }
+            memberships = set(
+                db.session.query(HackathonTeamMember.hackathon_team_id, HackathonTeamMember.member_id)
+                .filter(
+                    HackathonTeamMember.hackathon_team_id.in_(team_ids),
+                    HackathonTeamMember.member_id.in_({int(t.user_id) for t in tickets})
+                )
+            )
+
+        taken = (
+            db.session.query(HackathonRegistration.user_id, HackathonRegistration.team_id)
+            .filter(
+                HackathonRegistration.hackathon_id == hackathon_id,
+                or_(
+                    HackathonRegistration.user_id.in_({t.user_id for t in tickets}),
+                    HackathonRegistration.team_id.in_(team_ids)
+                )
+            )
+            .all()
+        )
+        registered_users = {str(row.user_id) for row in taken if row.user_id}
+        registered_teams = {row.team_id for row in taken if row.team_id}
+
+        seats_left = None
+        if hackathon.max_participants is not None:
+            seats_left = hackathon.max_participants - hackathon.seats_taken
+
+        rows = []
+        for ticket in tickets:
+            try:
+                registration, seats = RegistrationService._prepare_registration(
+                    hackathon, ticket.user_id, ticket.team_id, teams.get(ticket.team_id),
+                    (ticket.team_id, int(ticket.user_id)) in memberships
+                )
+            except RegistrationError as e:
+                ticket.status = "failed"
+                ticket.message = str(e)
+                continue
+
+            if registration.team_id:
+                duplicate = registration.team_id in registered_teams
+                registered_teams.add(registration.team_id)
+            else:
+                duplicate = str(ticket.user_id) in registered_users
+                registered_users.add(str(ticket.user_id))
+
+            if duplicate:
+                ticket.status = "failed"
+                ticket.message = "Already registered"
+                continue
+
+            if seats_left is not None and seats > seats_left:
+                ticket.status = "waitlisted"
+                continue
+
+            if seats_left is not None:
+                seats_left -= seats
+
+            registration_id = str(uuid.uuid4())
+            rows.append({
+                "id": registration_id,
+                "hackathon_id": hackathon_id,
+                "user_id": registration.user_id,
+                "team_id": registration.team_id,
+                "status": "pending",
+                "registered_at": now,
+                "seats": seats,
+            })
+            ticket.status = "registered"
+            ticket.registration_id = registration_id
+
+        if not rows:
+            return
+
+        participants = sum(row["seats"] for row in rows)
+
+        # The row lock makes this unconditional on Postgres; the condition
+        # still guards backends without SELECT ... FOR UPDATE
+        reserved = (
+            Hackathon.query
+            .filter(
+                Hackathon.id == hackathon_id,
+                or_(
+                    Hackathon.max_participants.is_(None),
+                    Hackathon.seats_taken + participants <= Hackathon.max_participants
+                )
+            )
+            .update(
+                {
+                    Hackathon.seats_taken: Hackathon.seats_taken + participants,
+                    Hackathon.participant_count: Hackathon.participant_count + participants,
+                },
+                synchronize_session=False
+            )
+        )
+        if not reserved:
+            # Direct registrations raced this batch; retry on the next drain
+            for ticket in tickets:
+                if ticket.status in ("registered", "waitlisted"):
+                    ticket.status = "queued"
+                    ticket.registration_id = None
+                    ticket.processed_at = None
+            return
+
+        RegistrationService._bump_stats(
+            hackathon_id,
+            total_registrations=len(rows),
+            pending=len(rows)
+        )
+        db.session.execute(insert(HackathonRegistration), rows)
+
     # ───────────── Status Update ─────────────
     @staticmethod
     def update_status(registration_id, status):
@@ -101,25 +457,276 @@ class RegistrationService:
         if not registration:
             raise RegistrationNotFoundError("Registration not found")
 
+        # Rejection frees the registration's seats, un-rejecting retakes them
+        seats_moved = (status == "rejected") != (registration.status == "rejected")
+        if status == "rejected" and registration.status != "rejected":
+            RegistrationService._release_seats(registration.hackathon_id, registration.seats)
+        elif registration.status == "rejected" and status != "rejected":
+            RegistrationService._reserve_seats(
+                registration.hackathon_id, registration.seats, participants=registration.seats
+            )
+
+        if registration.status != status:
+            deltas = {}
+            if registration.status in STATUS_COLUMNS:
+                deltas[registration.status] = -1
+            if status in STATUS_COLUMNS:
+                deltas[status] = 1
+            RegistrationService._bump_stats(registration.hackathon_id, **deltas)
+
         registration.status = status
+        user_id, team_id = registration.user_id, registration.team_id
+        hackathon_id = registration.hackathon_id
         db.session.commit()
+
+        if seats_moved:
+            evict_public_responses(hackathon_id)
+
+        RegistrationService._forget_users(
+            user_ids=[user_id],
+            team_ids=[team_id] if team_id else ()
+        )
         return registration
 
+    @staticmethod
+    def bulk_update_status(organizer_id, status, ids=None, hackathon_id=None, current_status=None):
+        """
+        Move many registrations to ``status`` with one set-based UPDATE.
+        Ownership is checked once per hackathon, seats and stats are adjusted
+        per hackathon, and every requested id gets an outcome: updated,
+        unchanged, not_found, forbidden or full.
+        """
+        query = db.session.query(
+            HackathonRegistration.id,
+            HackathonRegistration.hackathon_id,
+            HackathonRegistration.status,
+            HackathonRegistration.seats
+        )
+
+        if ids is not None:
+            ids = list(dict.fromkeys(ids))
+            query = query.filter(HackathonRegistration.id.in_(ids))
+        else:
+            hackathon = db.session.query(Hackathon.organizer_id).filter(
+                Hackathon.id == hackathon_id
+            ).first()
+            if not hackathon:
+                raise HackathonNotFoundError("Hackathon not found")
+            if hackathon.organizer_id != organizer_id:
+                raise PermissionError("You cannot manage someone else's registrations.")
+
+            query = query.filter(HackathonRegistration.hackathon_id == hackathon_id)
+            if current_status:
+                query = query.filter(HackathonRegistration.status == current_status)
+
+        rows = query.with_for_update().all()
+
+        outcomes = {}
+        if ids is not None:
+            outcomes = dict.fromkeys(ids, "not_found")
+
+        by_hackathon = {}
+        for row in rows:
+            by_hackathon.setdefault(row.hackathon_id, []).append(row)
+
+        owned = {
+            h.id
+            for h in db.session.query(Hackathon.id).filter(
+                Hackathon.id.in_(by_hackathon),
+                Hackathon.organizer_id == organizer_id
+            )
+        }
+
+        changed = []
+        seats_moved = set()
+        for hid, group in by_hackathon.items():
+            if hid not in owned:
+                outcomes.update(dict.fromkeys((row.id for row in group), "forbidden"))
+                continue
+
+            moving = []
+            for row in group:
+                if row.status == status:
+                    outcomes[row.id] = "unchanged"
+                else:
+                    moving.append(row)
+
+            # Un-rejecting retakes seats; all-or-nothing per hackathon
+            retake = sum(row.seats for row in moving if row.status == "rejected")
+            if retake:
+                reserved = (
+                    Hackathon.query
+                    .filter(
+                        Hackathon.id == hid,
+                        or_(
+                            Hackathon.max_participants.is_(None),
+                            Hackathon.seats_taken + retake <= Hackathon.max_participants
+                        )
+                    )
+                    .update(
+                        {
+                            Hackathon.seats_taken: Hackathon.seats_taken + retake,
+                            Hackathon.participant_count: Hackathon.participant_count + retake,
+                        },
+                        synchronize_session=False
+                    )
+                )
+                if not reserved:
+                    for row in moving:
+                        if row.status == "rejected":
+                            outcomes[row.id] = "full"
+                    moving = [row for row in moving if row.status != "rejected"]
+
+            if status == "rejected":
+                released = sum(row.seats for row in moving)
+                if released:
+                    RegistrationService._release_seats(hid, released)
+                    seats_moved.add(hid)
+            elif any(row.status == "rejected" for row in moving):
+                seats_moved.add(hid)
+
+            deltas = {}
+            for row in moving:
+                if row.status in STATUS_COLUMNS:
+                    deltas[row.status] = deltas.get(row.status, 0) - 1
+            if moving:
+                deltas[status] = deltas.get(status, 0) + len(moving)
+                RegistrationService._bump_stats(hid, **deltas)
+
+            for row in moving:
+                outcomes[row.id] = "updated"
+                changed.append(row.id)
+
+        if changed:
+            HackathonRegistration.query.filter(
+                HackathonRegistration.id.in_(changed)
+            ).update(
+                {HackathonRegistration.status: status},
+                synchronize_session=False
+            )
+
+        db.session.commit()
+
+        # Touches many users, most of whom have nothing cached here
+        if changed:
+            registration_cache.clear()
+        evict_public_responses(*seats_moved)
+
+        return {
+            "status": status,
+            "updated": len(changed),
+            "results": [
+                {"id": registration_id, "outcome": outcome}
+                for registration_id, outcome in outcomes.items()
+            ]
+        }
+
     # ───────────── Query Methods ─────────────
+    @staticmethod
+    def get_registration_map(user_id):
+        """
+        The user's registrations keyed by hackathon_id, individual ones and
+        those made through any of their teams, from one UNION query. Cached
+        per user in ``registration_cache``.
+        """
+        key = str(user_id)
+        cached = registration_cache.get(key)
+        if cached is not None:
+            return cached
+
+        columns = (
+            HackathonRegistration.id,
+            HackathonRegistration.hackathon_id,
+            HackathonRegistration.user_id,
+            HackathonRegistration.team_id,
+            HackathonRegistration.status,
+            HackathonRegistration.registered_at,
+        )
+
+        individual = db.session.query(*columns).filter(
+            HackathonRegistration.user_id == key
+        )
+        through_team = (
+            db.session.query(*columns)
+            .join(
+                HackathonTeamMember,
+                HackathonTeamMember.hackathon_team_id == HackathonRegistration.team_id
+            )
+            .filter(HackathonTeamMember.member_id == int(user_id))
+        )
+
+        registrations = {}
+        # Team rows first so an individual registration wins, as in the old check
+        for row in sorted(individual.union_all(through_team), key=lambda r: r.user_id is not None):
+            entry = row._asdict()
+            entry["mode"] = "individual" if row.user_id is not None else "team"
+            registrations[row.hackathon_id] = entry
+
+        registration_cache.set(key, registrations, ttl=current_app.config["REGISTRATION_CACHE_TTL"])
+        return registrations
+
     @staticmethod
     def get_user_registrations(user_id):
-        return HackathonRegistration.query.filter_by(user_id=user_id).all()
+        """Individual registrations of the user, served from the registration map."""
+        return [
+            entry
+            for entry in RegistrationService.get_registration_map(user_id).values()
+            if entry["mode"] == "individual"
+        ]
 
     @staticmethod
     def get_team_registrations(team_id):
-        return HackathonRegistration.query.filter_by(team_id=team_id).all()
+        return (
+            HackathonRegistration.query
+            .options(*registration_load_options("roster"))
+            .filter_by(team_id=team_id)
+            .all()
+        )
        
     @staticmethod
-    def get_hackathon_registrations(hackathon_id):
-        registrations = HackathonRegistration.query.filter_by(
-            hackathon_id=hackathon_id
-        ).all()
+    def get_hackathon_registrations(hackathon_id, limit=100, cursor=None, status=None):
+        """
+        One page of registrations with team rosters, keyset-paginated on
+        (registered_at, id). Teams are joined into the page query and
+        rosters come from the roster cache, so a warm page is one query.
+        ``limit=None`` returns every registration in the same order.
+        """
+        query = (
+            HackathonRegistration.query
+            .options(*registration_load_options("team"))
+            .filter(HackathonRegistration.hackathon_id == hackathon_id)
+        )
+
+        if status:
+            query = query.filter(HackathonRegistration.status == status)
+
+        if cursor:
+            registered_at, last_id = decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    HackathonRegistration.registered_at > registered_at,
+                    and_(
+                        HackathonRegistration.registered_at == registered_at,
+                        HackathonRegistration.id > last_id
+                    )
+                )
+            )
 
+        query = query.order_by(HackathonRegistration.registered_at, HackathonRegistration.id)
+
+        if limit is None:
+            registrations = query.all()
+        else:
+            limit = max(1, limit)
+            registrations = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if limit is not None and len(registrations) > limit:
+            registrations = registrations[:limit]
+            last = registrations[-1]
+            next_cursor = encode_cursor(last.registered_at, last.id)
+
+        rosters = get_rosters(reg.team for reg in registrations)
         result = []
 
         for reg in registrations:
@@ -134,114 +741,270 @@ class RegistrationService:
             }
 
             # Team-based registration
-            if reg.team_id:
-                team = HackathonTeam.query.get(reg.team_id)
-                if team:
-                    data["team"] = {
-                        "id": team.id,
-                        "name": team.name,
-                        "created_by": team.created_by,
-                        "members": [
-                            {
-                                "user_id": m.member_id,
-                                "name": m.user.name, 
-                                "role": m.role.value,
-                                "joined_at": m.joined_at
-                            }
-                            for m in team.members
-                        ]
-                    }
+            team = reg.team
+            if team:
+                data["team"] = {
+                    "id": team.id,
+                    "name": team.name,
+                    "created_by": team.created_by,
+                    "members": [
+                        {
+                            "user_id": m["member_id"],
+                            "name": m["name"],
+                            "role": m["role"],
+                            "joined_at": m["joined_at"]
+                        }
+                        for m in rosters[team.id]
+                    ]
+                }
 
             result.append(data)
 
-        return result
+        return result, next_cursor
 
     @staticmethod
-    def check_user_registration(hackathon_id, user_id):
-        user_id = int(user_id)
-
-        # Ensure hackathon exists (avoid silent false)
-        hackathon = Hackathon.query.get(hackathon_id)
+    def export_registrations(hackathon_id, organizer_id, status=None, chunk_size=1000):
+        """
+        Check ownership, then return a generator of one dict per participant
+        (one per member for team registrations). Rows come from a single
+        flat join read ``chunk_size`` at a time, which uses a server-side
+        cursor on Postgres, so memory stays flat however big the event is.
+        """
+        hackathon = db.session.query(Hackathon.organizer_id).filter(
+            Hackathon.id == hackathon_id
+        ).first()
         if not hackathon:
             raise HackathonNotFoundError("Hackathon not found")
+        if hackathon.organizer_id != organizer_id:
+            raise PermissionError("You cannot export someone else's registrations.")
+
+        registrant = aliased(User)
+        member = aliased(User)
+
+        query = (
+            db.session.query(
+                HackathonRegistration.id,
+                HackathonRegistration.status,
+                HackathonRegistration.registered_at,
+                HackathonRegistration.team_id,
+                HackathonTeam.name.label("team_name"),
+                HackathonTeamMember.role,
+                registrant.id.label("registrant_id"),
+                registrant.name.label("registrant_name"),
+                registrant.email.label("registrant_email"),
+                member.id.label("member_id"),
+                member.name.label("member_name"),
+                member.email.label("member_email"),
+            )
+            .select_from(HackathonRegistration)
+            .outerjoin(registrant, HackathonRegistration.user)
+            .outerjoin(HackathonTeam, HackathonRegistration.team)
+            .outerjoin(HackathonTeamMember, HackathonTeam.members)
+            .outerjoin(member, HackathonTeamMember.user)
+            .filter(HackathonRegistration.hackathon_id == hackathon_id)
+        )
 
-        # 1️⃣ Check individual registration
-        individual = HackathonRegistration.query.filter_by(
-            hackathon_id=hackathon_id,
-            user_id=user_id
-        ).first()
+        if status:
+            query = query.filter(HackathonRegistration.status == status)
+
+        query = query.order_by(
+            HackathonRegistration.registered_at,
+            HackathonRegistration.id,
+            HackathonTeamMember.joined_at
+        ).yield_per(chunk_size)
+
+        def rows():
+            for row in query:
+                team_row = row.team_id is not None
+                yield {
+                    "registration_id": row.id,
+                    "status": row.status,
+                    "registered_at": row.registered_at.isoformat() if row.registered_at else None,
+                    "team_id": row.team_id,
+                    "team_name": row.team_name,
+                    "role": row.role.value if row.role else None,
+                    "user_id": row.member_id if team_row else row.registrant_id,
+                    "name": row.member_name if team_row else row.registrant_name,
+                    "email": row.member_email if team_row else row.registrant_email,
+                }
 
-        if individual:
+        return rows()
+
+    @staticmethod
+    def check_user_registration(hackathon_id, user_id):
+        entry = RegistrationService.get_registration_map(user_id).get(hackathon_id)
+
+        if entry:
             return {
                 "registered": True,
-                "status": individual.status,
-                "mode": "individual",
-                "registration_id": individual.id,
-                "team_id": None
+                "status": entry["status"],
+                "mode": entry["mode"],
+                "registration_id": entry["id"],
+                "team_id": entry["team_id"]
             }
 
-        # 2️⃣ Check team-based registration
-        team_regs = (
-            HackathonRegistration.query
-            .filter_by(hackathon_id=hackathon_id)
-            .filter(HackathonRegistration.team_id.isnot(None))
+        # Ensure hackathon exists (avoid silent false)
+        hackathon = db.session.query(Hackathon.id).filter_by(id=hackathon_id).first()
+        if not hackathon:
+            raise HackathonNotFoundError("Hackathon not found")
+
+        # Not registered
+        return {
+            "registered": False
+        }
+
+    @staticmethod
+    def _aggregate_analytics(hackathon_id):
+        """Status counts and participant total in one grouped query."""
+        # Individual registration counts 1, team registration its member
+        # count, rejected ones nothing (as participant_count)
+        participants = case(
+            (HackathonRegistration.status == "rejected", 0),
+            (HackathonRegistration.user_id.isnot(None), 1),
+            else_=db.func.coalesce(HackathonTeam.member_count, 0)
+        )
+
+        rows = (
+            db.session.query(
+                HackathonRegistration.status,
+                db.func.count(HackathonRegistration.id),
+                db.func.coalesce(db.func.sum(participants), 0)
+            )
+            .outerjoin(HackathonTeam, HackathonTeam.id == HackathonRegistration.team_id)
+            .filter(HackathonRegistration.hackathon_id == hackathon_id)
+            .group_by(HackathonRegistration.status)
             .all()
         )
 
-        for reg in team_regs:
-            team = HackathonTeam.query.get(reg.team_id)
-            if not team:
-                continue
+        analytics = {
+            "total_registrations": 0,
+            "approved": 0,
+            "pending": 0,
+            "rejected": 0,
+            "total_participants": 0
+        }
+        for status, count, people in rows:
+            analytics["total_registrations"] += count
+            analytics["total_participants"] += int(people)
+            if status in STATUS_COLUMNS:
+                analytics[status] += count
 
-            member_ids = {m.member_id for m in team.members}
-            if user_id in member_ids:
-                return {
-                    "registered": True,
-                    "status": reg.status,
-                    "mode": "team",
-                    "registration_id": reg.id,
-                    "team_id": reg.team_id
-                }
+        return analytics
 
-        # 3️⃣ Not registered
-        return {
-            "registered": False
-        }
+    @staticmethod
+    def _ensure_stats(hackathon_id):
+        """
+        Return the registration_stats row, seeding it from the grouped query
+        the first time so events registered before it existed start correct.
+        """
+        stats = RegistrationStats.query.get(hackathon_id)
+        if stats:
+            return stats
+
+        counts = RegistrationService._aggregate_analytics(hackathon_id)
+        del counts["total_participants"]
+
+        try:
+            with db.session.begin_nested():
+                stats = RegistrationStats(hackathon_id=hackathon_id, **counts)
+                db.session.add(stats)
+        except IntegrityError:
+            # Seeded concurrently by another request
+            stats = RegistrationStats.query.get(hackathon_id)
+
+        return stats
 
     @staticmethod
-    def get_hackathon_analytics(hackathon_id):
-        hackathon = Hackathon.query.get(hackathon_id)
-        if not hackathon:
-            raise HackathonNotFoundError("Hackathon not found")
+    def _bump_stats(hackathon_id, **deltas):
+        """Atomically add ``deltas`` to the hackathon's counters."""
+        if not current_app.config["REGISTRATION_STATS_ENABLED"]:
+            return
+
+        RegistrationService._ensure_stats(hackathon_id)
+        RegistrationStats.query.filter_by(hackathon_id=hackathon_id).update(
+            {
+                getattr(RegistrationStats, column): getattr(RegistrationStats, column) + delta
+                for column, delta in deltas.items()
+                if delta
+            },
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def reconcile_participant_counts(chunk_size=500, fix=True):
+        """
+        Compare participant_count with the registrations that are not
+        rejected (1 per individual, member_count per team), one chunk of
+        hackathons per transaction.
+        Run after TeamService.reconcile_member_counts. Returns
+        {hackathon_id: (stored, actual)} for every hackathon that drifted.
+        """
+        drift = {}
+        last_id = None
+
+        participants = case(
+            (HackathonRegistration.user_id.isnot(None), 1),
+            else_=db.func.coalesce(HackathonTeam.member_count, 0)
+        )
 
-        # Base query
-        registrations = HackathonRegistration.query.filter_by(
-            hackathon_id=hackathon_id
-        ).all()
+        while True:
+            chunk = Hackathon.query.with_entities(Hackathon.id, Hackathon.participant_count)
+            if last_id is not None:
+                chunk = chunk.filter(Hackathon.id > last_id)
+            chunk = chunk.order_by(Hackathon.id).limit(chunk_size).all()
+            if not chunk:
+                break
+
+            ids = [hackathon_id for hackathon_id, _ in chunk]
+            actual = dict(
+                db.session.query(HackathonRegistration.hackathon_id, db.func.sum(participants))
+                .outerjoin(HackathonTeam, HackathonTeam.id == HackathonRegistration.team_id)
+                .filter(
+                    HackathonRegistration.hackathon_id.in_(ids),
+                    HackathonRegistration.status != "rejected"
+                )
+                .group_by(HackathonRegistration.hackathon_id)
+                .all()
+            )
 
-        total_registrations = len(registrations)
+            for hackathon_id, stored in chunk:
+                count = int(actual.get(hackathon_id) or 0)
+                if stored != count:
+                    drift[hackathon_id] = (stored, count)
+                    if fix:
+                        Hackathon.query.filter(Hackathon.id == hackathon_id).update(
+                            {Hackathon.participant_count: count},
+                            synchronize_session=False
+                        )
 
-        approved = sum(1 for r in registrations if r.status == "approved")
-        pending = sum(1 for r in registrations if r.status == "pending")
-        rejected = sum(1 for r in registrations if r.status == "rejected")
+            db.session.commit()
+            last_id = ids[-1]
 
-        total_participants = 0
+        if fix:
+            evict_public_responses(*drift)
+        return drift
 
-        for reg in registrations:
-            # Individual registration
-            if reg.user_id:
-                total_participants += 1
+    @staticmethod
+    def get_hackathon_analytics(hackathon_id):
+        hackathon = (
+            db.session.query(Hackathon.id, Hackathon.participant_count)
+            .filter_by(id=hackathon_id)
+            .first()
+        )
+        if not hackathon:
+            raise HackathonNotFoundError("Hackathon not found")
 
-            # Team registration
-            elif reg.team_id:
-                team = HackathonTeam.query.get(reg.team_id)
-                if team:
-                    total_participants += len(team.members)
+        if not current_app.config["REGISTRATION_STATS_ENABLED"]:
+            return RegistrationService._aggregate_analytics(hackathon_id)
+
+        # O(1) read of the maintained counters
+        stats = RegistrationService._ensure_stats(hackathon_id)
+        db.session.commit()
 
         return {
-            "total_registrations": total_registrations,
-            "approved": approved,
-            "pending": pending,
-            "rejected": rejected,
-            "total_participants": total_participants
-        }
\ No newline at end of file
+            "total_registrations": stats.total_registrations,
+            "approved": stats.approved,
+            "pending": stats.pending,
+            "rejected": stats.rejected,
+            "total_participants": hackathon.participant_count
+        }
@@ -0,0 +1,29 @@
+from app.cache import TTLCache
+from app.modules.registration.model import HackathonRegistration
+from app.modules.teams.models import HackathonTeam, HackathonTeamMember
+from app.modules.teams.utils import eager_chains
+
+
+# Per-user read model: hackathon_id -> registration, covering individual and
+# team registrations. Filled by RegistrationService.get_registration_map and
+# dropped for the affected users on registration and team membership writes.
+registration_cache = TTLCache(maxsize=4096)
+
+
+# Relationship chains each profile eager-loads below a HackathonRegistration.
+# "team" is the team row alone (rosters then come from get_rosters), "roster"
+# is what RegistrationResponseSchema renders (the team, its members and their
+# users); "full" adds the individual registrant.
+_TEAM_ROSTER = (HackathonRegistration.team, HackathonTeam.members, HackathonTeamMember.user)
+
+REGISTRATION_LOAD_PROFILES = {
+    "bare": (),
+    "team": ((HackathonRegistration.team,),),
+    "roster": (_TEAM_ROSTER,),
+    "full": (_TEAM_ROSTER, (HackathonRegistration.user,)),
+}
+
+
+def registration_load_options(profile: str = "bare") -> list:
+    """Loader options for a registration load profile."""
+    return eager_chains(REGISTRATION_LOAD_PROFILES[profile])
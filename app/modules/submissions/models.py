@@ -66,6 +66,8 @@ class JudgeScore(db.Model):
             "judge_id",
             name="uq_submission_judge_score"
         ),
+        # Covers the grouped avg/count/min/max in ScoringService.score_summary
+        db.Index("ix_judge_scores_submission_score", "submission_id", "score"),
     )
 
 
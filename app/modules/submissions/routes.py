@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.idempotency import idempotent
 
 from app.modules.submissions.schemas import (
     ProjectSubmissionCreateSchema,
@@ -14,6 +15,7 @@ from app.modules.submissions.services import (
 from app.modules.submissions.models import ProjectSubmission
 from app.modules.submissions.permission import require_judge_or_organizer
 from app.modules.hackathons.models import Hackathon
+from app.modules.teams.utils import team_load_options, get_rosters
 from app.extensions import db
 
 submission_bp = Blueprint("submissions", __name__)
@@ -22,6 +24,7 @@ submission_bp = Blueprint("submissions", __name__)
 
 @submission_bp.route("/hackathons/<hackathon_id>", methods=["POST"])
 @jwt_required()
+@idempotent
 def submit_project(hackathon_id):
     data = ProjectSubmissionCreateSchema(**request.json)
 
@@ -40,10 +43,15 @@ def list_submissions(hackathon_id):
     user_id = get_jwt_identity()
     require_judge_or_organizer(user_id, hackathon_id)
 
-    submissions = ProjectSubmission.query.filter_by(
-        hackathon_id=hackathon_id
-    ).all()
+    submissions = (
+        ProjectSubmission.query
+        .options(*team_load_options("bare", via=(ProjectSubmission.team,)))
+        .filter_by(hackathon_id=hackathon_id)
+        .all()
+    )
 
+    rosters = get_rosters(s.team for s in submissions)
+    scores = ScoringService.score_summary(hackathon_id=hackathon_id)
     response = []
 
     for s in submissions:
@@ -57,19 +65,19 @@ def list_submissions(hackathon_id):
             "github_url": s.github_url,
             "live_url": s.live_url,
             "created_at": s.created_at.isoformat(),
-            "average_score": ScoringService.calculate_average(s),
+            "average_score": scores.get(s.id, {}).get("average"),
             "team": {
                 "id": team.id,
                 "name": team.name,
                 "created_by": team.created_by,
                 "members": [
                     {
-                        "user_id": m.member_id,          # ✅ correct column
-                        "name": m.user.name,             # ✅ via relationship
-                        "role": m.role.value,            # ✅ Enum → string
-                        "joined_at": m.joined_at.isoformat()
+                        "user_id": m["member_id"],
+                        "name": m["name"],
+                        "role": m["role"],
+                        "joined_at": m["joined_at"].isoformat()
                     }
-                    for m in team.members
+                    for m in rosters[team.id]
                 ]
             }
         })
@@ -103,22 +111,17 @@ def finalize_winners(hackathon_id):
     if hackathon.organizer_id != user_id:
         return jsonify({"message": "Only organizer can finalize"}), 403
 
-    submissions = ProjectSubmission.query.filter_by(
-        hackathon_id=hackathon_id
-    ).all()
-
-    ranked = sorted(
-        submissions,
-        key=lambda s: ScoringService.calculate_average(s) or 0,
-        reverse=True
+    ranked = ScoringService.rank_submissions(
+        hackathon_id,
+        team_load_options("bare", via=(ProjectSubmission.team,))
     )
 
     winners = []
-    for idx, sub in enumerate(ranked[:3], start=1):
+    for idx, (sub, average) in enumerate(ranked[:3], start=1):
         winners.append({
             "position": idx,
             "team": sub.team.name,
-            "score": ScoringService.calculate_average(sub)
+            "score": average
         })
 
     return jsonify(winners)
@@ -129,7 +132,11 @@ def finalize_winners(hackathon_id):
 def get_submission(submission_id):
     user_id = get_jwt_identity()
 
-    submission = ProjectSubmission.query.get_or_404(submission_id)
+    submission = (
+        ProjectSubmission.query
+        .options(*team_load_options("bare", via=(ProjectSubmission.team,)))
+        .get_or_404(submission_id)
+    )
     require_judge_or_organizer(user_id, submission.hackathon_id)
 
     team = submission.team
@@ -149,12 +156,12 @@ def get_submission(submission_id):
             "created_by": team.created_by,
             "members": [
                 {
-                    "user_id": m.member_id,
-                    "name": m.user.name,
-                    "role": m.role.value,
-                    "joined_at": m.joined_at.isoformat()
+                    "user_id": m["member_id"],
+                    "name": m["name"],
+                    "role": m["role"],
+                    "joined_at": m["joined_at"].isoformat()
                 }
-                for m in team.members
+                for m in get_rosters([team])[team.id]
             ]
         }
     }), 200
@@ -208,12 +215,12 @@ def get_my_submission(hackathon_id):
             "created_by": team.created_by,
             "members": [
                 {
-                    "user_id": m.member_id,
-                    "name": m.user.name,
-                    "role": m.role.value,
-                    "joined_at": m.joined_at.isoformat()
+                    "user_id": m["member_id"],
+                    "name": m["name"],
+                    "role": m["role"],
+                    "joined_at": m["joined_at"].isoformat()
                 }
-                for m in team.members
+                for m in get_rosters([team])[team.id]
             ]
         }
     }), 200
@@ -5,6 +5,7 @@ from app.modules.submissions.models import (
     JudgeScore
 )
 from app.modules.teams.models import HackathonTeamMember
+from app.modules.teams.utils import team_load_options
 
 
 class SubmissionService:
@@ -56,6 +57,7 @@ class SubmissionService:
         # 2️⃣ Find submission for this hackathon & user's team
         submission = (
             ProjectSubmission.query
+            .options(*team_load_options("bare", via=(ProjectSubmission.team,)))
             .filter(ProjectSubmission.hackathon_id == hackathon_id)
             .filter(ProjectSubmission.team_id.in_(team_ids))
             .first()
@@ -92,14 +94,65 @@ class ScoringService:
         db.session.commit()
         return existing
 
+    @staticmethod
+    def score_summary(hackathon_id=None, submission_ids=None):
+        """
+        avg, count, min and max of the judge scores of every submission of
+        a hackathon (or of ``submission_ids``) from one grouped query over
+        judge_scores. Submissions without scores are absent from the result.
+        """
+        query = db.session.query(
+            JudgeScore.submission_id,
+            db.func.avg(JudgeScore.score).label("average"),
+            db.func.count(JudgeScore.id).label("count"),
+            db.func.min(JudgeScore.score).label("min"),
+            db.func.max(JudgeScore.score).label("max")
+        )
+
+        if hackathon_id is not None:
+            query = query.join(
+                ProjectSubmission, ProjectSubmission.id == JudgeScore.submission_id
+            ).filter(ProjectSubmission.hackathon_id == hackathon_id)
+
+        if submission_ids is not None:
+            query = query.filter(JudgeScore.submission_id.in_(submission_ids))
+
+        return {
+            row.submission_id: {
+                "average": round(float(row.average), 2),
+                "count": row.count,
+                "min": row.min,
+                "max": row.max,
+            }
+            for row in query.group_by(JudgeScore.submission_id)
+        }
+
     @staticmethod
     def calculate_average(submission):
-        if not submission.scores:
+        summary = ScoringService.score_summary(submission_ids=[submission.id])
+        if submission.id not in summary:
             return None
 
-        return round(
-            sum(s.score for s in submission.scores) / len(submission.scores),
-            2
+        return summary[submission.id]["average"]
+
+    @staticmethod
+    def rank_submissions(hackathon_id, options=()):
+        """
+        Submissions of a hackathon best first, paired with their average
+        (None when unscored, ranked as 0). Two queries in total.
+        """
+        submissions = (
+            ProjectSubmission.query
+            .options(*options)
+            .filter_by(hackathon_id=hackathon_id)
+            .all()
         )
+        summary = ScoringService.score_summary(hackathon_id=hackathon_id)
+
+        scored = [
+            (submission, summary.get(submission.id, {}).get("average"))
+            for submission in submissions
+        ]
+        return sorted(scored, key=lambda pair: pair[1] or 0, reverse=True)
 
     
\ No newline at end of file
@@ -15,12 +15,15 @@ class HackathonTeam(db.Model):
     name = db.Column(db.String(150),nullable=False)
     created_by = db.Column(db.Integer,db.ForeignKey("users.id"),nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    # Kept in step with hackathon_team_members by TeamService
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    # Bumped by every roster change (members, roles, member names); keys the roster cache
+    roster_version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
      # ✅ EXPLICIT relationship
     members = db.relationship(
         "HackathonTeamMember",
         back_populates="team",
-        cascade="all, delete-orphan",
-        lazy="joined"
+        cascade="all, delete-orphan"
     )
 
 
@@ -31,10 +34,15 @@ class HackathonTeamMember(db.Model):
     hackathon_team_id = db.Column(db.String,db.ForeignKey("hackathon_teams.id"),nullable=False)
     member_id = db.Column(db.Integer,db.ForeignKey("users.id"),nullable=False)
     role = db.Column(db.Enum(TeamMemberRole, name="team_member_role"),default=TeamMemberRole.MEMBER)
-    joined_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    joined_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
 
      # ✅ MATCHES back_populates
     team = db.relationship("HackathonTeam", back_populates="members")
 
     # ✅ User relationship (for name, email, etc.)
-    user = db.relationship("User", lazy="joined")
\ No newline at end of file
+    user = db.relationship("User")
+
+    __table_args__ = (
+        # "Which teams is this user in?" lookups and membership joins
+        db.Index("ix_team_members_member_team", "member_id", "hackathon_team_id"),
+    )
\ No newline at end of file
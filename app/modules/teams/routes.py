@@ -1,8 +1,9 @@
 from flask import Blueprint,request,jsonify
 from flask_jwt_extended import jwt_required,get_jwt_identity
+from app.idempotency import idempotent
 from .services import TeamService
 from pydantic import ValidationError
-from .schemas import (AddMemberSchema,TeamCreateSchema,TeamMemberReadSchema,RemoveMemberParamsSchema,UpdateMemberRoleSchema)
+from .schemas import (AddMemberSchema,BulkMembersSchema,TeamCreateSchema,TeamMemberReadSchema,RemoveMemberParamsSchema,UpdateMemberRoleSchema)
 from app.modules.teams.models import HackathonTeam,HackathonTeamMember
 team_bp = Blueprint("teams", __name__)
 
@@ -12,6 +13,7 @@ def check_team():
 
 @team_bp.route('/create',methods=['POST'])
 @jwt_required()
+@idempotent
 def create_team():  
     try:
         payload = TeamCreateSchema(**request.get_json())
@@ -55,6 +57,32 @@ def add_member(team_id):
         "joined_at": member.joined_at.isoformat()
     }), 201
 
+@team_bp.route('/<team_id>/members/batch',methods=['POST'])
+@jwt_required()
+def bulk_update_members(team_id):
+    try:
+        payload = BulkMembersSchema(**request.get_json())
+    except ValidationError as e:
+        return {"errors": e.errors()}, 400
+
+    if len(payload.add) + len(payload.remove) > 500:
+        return {"error": "At most 500 members per batch"}, 400
+
+    requester_id = int(get_jwt_identity())
+
+    member_count, results = TeamService.bulk_update_members(
+        team_id=team_id,
+        requester_id=requester_id,
+        add=[(m.member_id, m.role.value) for m in payload.add],
+        remove=payload.remove
+    )
+
+    return jsonify({
+        "team_id": team_id,
+        "member_count": member_count,
+        "results": results
+    }), 200
+
 @team_bp.route('/<team_id>/members/<member_id>',methods=['DELETE'])
 @jwt_required()
 def remove_member(team_id,member_id):
@@ -15,6 +15,10 @@ class AddMemberSchema(BaseModel):
     member_id: int
     role: TeamRoleEnum = TeamRoleEnum.member
 
+class BulkMembersSchema(BaseModel):
+    add: List[AddMemberSchema] = []
+    remove: List[int] = []
+
 class UpdateMemberRoleSchema(BaseModel):
     role: TeamRoleEnum
 
@@ -1,12 +1,21 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import insert, or_
 from app.extensions import db   
 from app.modules.teams.models import (HackathonTeamMember,HackathonTeam,TeamMemberRole)
 from app.modules.teams.exceptions import (NotTeamOwnerException,MemberNotFoundException,MemberAlreadyExistsException,TeamNotFoundException)
 from app.modules.users.models import User
+from app.modules.hackathons.models import Hackathon
+from app.modules.hackathons.utils import evict_public_responses
+from app.modules.registration.model import HackathonRegistration
+from app.modules.registration.exceptions import RegistrationFullError
+from app.modules.registration.utils import registration_cache
+from app.modules.teams.utils import get_team, get_rosters
 class TeamService:
 
     @staticmethod
     def create_team(name,created_by):
-        team = HackathonTeam(name=name,created_by=created_by)
+        team = HackathonTeam(name=name,created_by=created_by,member_count=1)
         db.session.add(team)
         db.session.flush()
         
@@ -15,6 +24,86 @@ class TeamService:
         db.session.commit()
         return team
     
+    @staticmethod
+    def _bump_member_count(team_id, delta):
+        """
+        Move the team's member_count inside the caller's transaction and
+        bump roster_version.
+
+        Team registrations hold one seat per member, so their seats follow
+        too. For hackathons where the registration is not rejected, seats_taken
+        and participant_count move by the same delta, through the same
+        conditional UPDATE as registration. If that would
+        exceed any max_participants, the transaction is rolled back and
+        RegistrationFullError is raised.
+
+        Returns the ids of the hackathons that moved, for the caller to
+        pass to evict_public_responses after committing.
+        """
+        HackathonTeam.query.filter(HackathonTeam.id == team_id).update(
+            {
+                HackathonTeam.member_count: HackathonTeam.member_count + delta,
+                HackathonTeam.roster_version: HackathonTeam.roster_version + 1,
+            },
+            synchronize_session=False
+        )
+
+        HackathonRegistration.query.filter(HackathonRegistration.team_id == team_id).update(
+            {HackathonRegistration.seats: HackathonRegistration.seats + delta},
+            synchronize_session=False
+        )
+
+        holding = db.session.query(HackathonRegistration.hackathon_id).filter(
+            HackathonRegistration.team_id == team_id,
+            HackathonRegistration.status != "rejected"
+        )
+        hackathon_ids = [hackathon_id for (hackathon_id,) in holding]
+        if hackathon_ids:
+            seats = Hackathon.query.filter(Hackathon.id.in_(hackathon_ids))
+            if delta > 0:
+                seats = seats.filter(
+                    or_(
+                        Hackathon.max_participants.is_(None),
+                        Hackathon.seats_taken + delta <= Hackathon.max_participants
+                    )
+                )
+
+            reserved = seats.update(
+                {
+                    Hackathon.seats_taken: Hackathon.seats_taken + delta,
+                    Hackathon.participant_count: Hackathon.participant_count + delta,
+                },
+                synchronize_session=False
+            )
+            if reserved < len(hackathon_ids):
+                db.session.rollback()
+                raise RegistrationFullError(
+                    "A hackathon this team is registered for has no seats left"
+                )
+
+        return hackathon_ids
+
+    @staticmethod
+    def bump_roster_versions(team_ids=None, member_id=None):
+        """
+        Invalidate cached rosters of ``team_ids``, or of every team
+        ``member_id`` belongs to (e.g. after a name change), inside the
+        caller's transaction.
+        """
+        query = HackathonTeam.query
+        if member_id is not None:
+            query = query.filter(HackathonTeam.id.in_(
+                db.session.query(HackathonTeamMember.hackathon_team_id)
+                .filter(HackathonTeamMember.member_id == member_id)
+            ))
+        else:
+            query = query.filter(HackathonTeam.id.in_(team_ids))
+
+        query.update(
+            {HackathonTeam.roster_version: HackathonTeam.roster_version + 1},
+            synchronize_session=False
+        )
+
     @staticmethod
     def _ensure_owner(team,user_id):
         if team.created_by != user_id:
@@ -22,7 +111,7 @@ class TeamService:
     
     @staticmethod
     def add_member(team_id, requester_id, member_id, role):
-        team = HackathonTeam.query.get(team_id)
+        team = get_team(team_id)
         if not team:
             raise TeamNotFoundException("Team not found")
 
@@ -43,12 +132,19 @@ class TeamService:
         )
 
         db.session.add(member)
+        moved = TeamService._bump_member_count(team_id, 1)
         db.session.commit()
+
+        # Cached public hackathon pages show participant_count
+        evict_public_responses(*moved)
+
+        # The new member now sees the team's registrations
+        registration_cache.delete(str(member_id))
         return member
     
     @staticmethod
     def remove_member(team_id, requester_id, member_id):
-        team = HackathonTeam.query.get(team_id)
+        team = get_team(team_id)
         if not team:
             raise TeamNotFoundException("Team not found")
 
@@ -63,11 +159,107 @@ class TeamService:
             raise MemberNotFoundException("Member not found")
 
         db.session.delete(member)
+        moved = TeamService._bump_member_count(team_id, -1)
+        db.session.commit()
+
+        evict_public_responses(*moved)
+        registration_cache.delete(str(member_id))
+
+    @staticmethod
+    def bulk_update_members(team_id, requester_id, add=(), remove=()):
+        """
+        Add and remove many members in one transaction: one IN query for
+        current members, one for unknown users, one bulk INSERT and one
+        DELETE. ``add`` holds (member_id, role) pairs. Returns the new
+        member count and a result per requested member.
+        """
+        team = get_team(team_id)
+        if not team:
+            raise TeamNotFoundException("Team not found")
+
+        TeamService._ensure_owner(team, requester_id)
+
+        add = list(dict(add).items())
+        remove = list(dict.fromkeys(remove))
+        conflicting = {member_id for member_id, _ in add} & set(remove)
+        touched = {member_id for member_id, _ in add} | set(remove)
+
+        current = {
+            member_id
+            for (member_id,) in db.session.query(HackathonTeamMember.member_id).filter(
+                HackathonTeamMember.hackathon_team_id == team_id,
+                HackathonTeamMember.member_id.in_(touched)
+            )
+        }
+        known_users = {
+            user_id
+            for (user_id,) in db.session.query(User.id).filter(
+                User.id.in_({member_id for member_id, _ in add} - current)
+            )
+        }
+
+        results = []
+        rows = []
+        for member_id, role in add:
+            if member_id in conflicting:
+                result = "conflict"
+            elif member_id in current:
+                result = "already_member"
+            elif member_id not in known_users:
+                result = "user_not_found"
+            else:
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "hackathon_team_id": team_id,
+                    "member_id": member_id,
+                    "role": TeamMemberRole(role),
+                    "joined_at": datetime.now(timezone.utc),
+                })
+                result = "added"
+            results.append({"member_id": member_id, "action": "add", "result": result})
+
+        removed = []
+        for member_id in remove:
+            if member_id in conflicting:
+                result = "conflict"
+            elif member_id == team.created_by:
+                result = "is_owner"
+            elif member_id not in current:
+                result = "not_member"
+            else:
+                removed.append(member_id)
+                result = "removed"
+            results.append({"member_id": member_id, "action": "remove", "result": result})
+
+        if rows:
+            db.session.execute(insert(HackathonTeamMember), rows)
+
+        if removed:
+            HackathonTeamMember.query.filter(
+                HackathonTeamMember.hackathon_team_id == team_id,
+                HackathonTeamMember.member_id.in_(removed)
+            ).delete(synchronize_session=False)
+
+        delta = len(rows) - len(removed)
+        member_count = team.member_count + delta
+        moved = []
+        if delta:
+            moved = TeamService._bump_member_count(team_id, delta)
+        elif rows:
+            # Swapped as many members in as out; the roster still changed
+            TeamService.bump_roster_versions(team_ids=[team_id])
+
         db.session.commit()
 
+        evict_public_responses(*moved)
+        for member_id in [row["member_id"] for row in rows] + removed:
+            registration_cache.delete(str(member_id))
+
+        return member_count, results
+
     @staticmethod
     def update_member_role(team_id,member_id,new_role,requester_id):
-        team = HackathonTeam.query.get(team_id)
+        team = get_team(team_id)
         if not team:
             raise TeamNotFoundException("Team not found")
 
@@ -82,54 +274,89 @@ class TeamService:
             raise MemberNotFoundException("Member not found")
 
         member.role = TeamMemberRole(new_role)
+        TeamService.bump_roster_versions(team_ids=[team_id])
         db.session.commit()
         return member
     
     @staticmethod
-    def _serialize_team(team: HackathonTeam):
-        members = (
-            db.session.query(HackathonTeamMember, User)
-            .join(User, User.id == HackathonTeamMember.member_id)
-            .filter(HackathonTeamMember.hackathon_team_id == team.id)
-            .all()
-        )
+    def _serialize_team(team: HackathonTeam, roster=None):
+        if roster is None:
+            roster = get_rosters([team])[team.id]
 
         return {
             "team_id": team.id,
             "team_name": team.name,
             "created_by": team.created_by,
             "created_at": team.created_at.isoformat(),
-            "members_count": len(members),
+            "members_count": team.member_count,
             "members": [
                 {
-                    "member_id": m.member_id,
-                    "name": u.name,
-                    "role": m.role.value,
-                    "joined_at": m.joined_at.isoformat(),
+                    "member_id": m["member_id"],
+                    "name": m["name"],
+                    "role": m["role"],
+                    "joined_at": m["joined_at"].isoformat(),
                 }
-                for m, u in members
+                for m in roster
             ],
         }
 
 
+    @staticmethod
+    def reconcile_member_counts(chunk_size=500, fix=True):
+        """
+        Compare member_count with hackathon_team_members, one chunk of teams
+        per transaction. Returns {team_id: (stored, actual)} for every team
+        that drifted; the rows are corrected unless ``fix`` is False.
+        """
+        drift = {}
+        last_id = None
+
+        while True:
+            chunk = HackathonTeam.query.with_entities(HackathonTeam.id, HackathonTeam.member_count)
+            if last_id is not None:
+                chunk = chunk.filter(HackathonTeam.id > last_id)
+            chunk = chunk.order_by(HackathonTeam.id).limit(chunk_size).all()
+            if not chunk:
+                break
+
+            ids = [team_id for team_id, _ in chunk]
+            actual = dict(
+                db.session.query(HackathonTeamMember.hackathon_team_id, db.func.count(HackathonTeamMember.id))
+                .filter(HackathonTeamMember.hackathon_team_id.in_(ids))
+                .group_by(HackathonTeamMember.hackathon_team_id)
+                .all()
+            )
+
+            for team_id, stored in chunk:
+                count = actual.get(team_id, 0)
+                if stored != count:
+                    drift[team_id] = (stored, count)
+                    if fix:
+                        HackathonTeam.query.filter(HackathonTeam.id == team_id).update(
+                            {HackathonTeam.member_count: count},
+                            synchronize_session=False
+                        )
+
+            db.session.commit()
+            last_id = ids[-1]
+
+        return drift
+
     @staticmethod
     def get_team_details(team_id):
-        team = HackathonTeam.query.get(team_id)
-        members = team.members
+        team = get_team(team_id, "full")
         if not team:
             raise TeamNotFoundException("Team not found")
-        return team,members
+        return team,team.members
     
     @staticmethod
     def get_my_teams(user_id: int):
-        memberships = HackathonTeamMember.query.filter_by(
-            member_id=user_id
-        ).all()
-
-        team_ids = {m.hackathon_team_id for m in memberships}
+        """Teams of the user; rosters come from the roster cache."""
+        team_ids = db.session.query(HackathonTeamMember.hackathon_team_id).filter(
+            HackathonTeamMember.member_id == user_id
+        )
 
-        teams = HackathonTeam.query.filter(
-            HackathonTeam.id.in_(team_ids)
-        ).all()
+        teams = HackathonTeam.query.filter(HackathonTeam.id.in_(team_ids)).all()
+        rosters = get_rosters(teams)
 
-        return [TeamService._serialize_team(team) for team in teams]
+        return [TeamService._serialize_team(team, rosters[team.id]) for team in teams]
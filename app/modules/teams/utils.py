@@ -0,0 +1,106 @@
+from flask import current_app
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.cache import TTLCache
+from app.extensions import db
+from app.modules.teams.models import HackathonTeam, HackathonTeamMember
+from app.modules.users.models import User
+
+
+# Rendered rosters keyed by (team_id, roster_version). A roster change bumps
+# the version, so readers that load the team row never see a stale entry.
+roster_cache = TTLCache(maxsize=4096)
+
+
+# Relationship chains each profile eager-loads below a HackathonTeam.
+# "bare" is the row alone (owner checks, counts), "roster" adds the member
+# rows (membership and size checks), "full" adds the members' users too
+# (anything that renders names).
+TEAM_LOAD_PROFILES = {
+    "bare": (),
+    "roster": ((HackathonTeam.members,),),
+    "full": ((HackathonTeam.members, HackathonTeamMember.user),),
+}
+
+
+def eager_chains(chains, via: tuple = ()) -> list:
+    """
+    One loader option per relationship chain, each prefixed with the ``via``
+    path, e.g. ``(ProjectSubmission.team,)``, when the query starts above
+    the entity the chains belong to. Many-to-one hops are JOINed into the
+    parent query, collections are fetched with one SELECT ... IN per hop.
+    """
+    options = []
+    for chain in chains or ((),):
+        path = tuple(via) + tuple(chain)
+        if not path:
+            continue
+
+        loader = None
+        for attr in path:
+            strategy = "selectinload" if attr.property.uselist else "joinedload"
+            if loader is None:
+                loader = {"selectinload": selectinload, "joinedload": joinedload}[strategy](attr)
+            else:
+                loader = getattr(loader, strategy)(attr)
+        options.append(loader)
+
+    return options
+
+
+def team_load_options(profile: str = "bare", via: tuple = ()) -> list:
+    """Loader options for a team load profile, optionally reached via a path."""
+    return eager_chains(TEAM_LOAD_PROFILES[profile], via)
+
+
+def get_team(team_id: str, profile: str = "bare"):
+    """Load one team by id with the given load profile."""
+    return HackathonTeam.query.options(*team_load_options(profile)).get(team_id)
+
+
+def get_rosters(teams) -> dict:
+    """
+    Roster of every given team as a list of member dicts (member_id, name,
+    role, joined_at) in join order, keyed by team id. Cache misses are built together
+    with one members JOIN users query.
+    """
+    rosters = {}
+    missing = {}
+    for team in teams:
+        if team is None or team.id in rosters or team.id in missing:
+            continue
+
+        cached = roster_cache.get((team.id, team.roster_version))
+        if cached is None:
+            missing[team.id] = team.roster_version
+        else:
+            rosters[team.id] = cached
+
+    if missing:
+        built = {team_id: [] for team_id in missing}
+        rows = (
+            db.session.query(
+                HackathonTeamMember.hackathon_team_id,
+                HackathonTeamMember.member_id,
+                HackathonTeamMember.role,
+                HackathonTeamMember.joined_at,
+                User.name
+            )
+            .join(User, User.id == HackathonTeamMember.member_id)
+            .filter(HackathonTeamMember.hackathon_team_id.in_(missing))
+            .order_by(HackathonTeamMember.joined_at, HackathonTeamMember.id)
+        )
+        for row in rows:
+            built[row.hackathon_team_id].append({
+                "member_id": row.member_id,
+                "name": row.name,
+                "role": row.role.value,
+                "joined_at": row.joined_at,
+            })
+
+        ttl = current_app.config["TEAM_ROSTER_CACHE_TTL"]
+        for team_id, roster in built.items():
+            roster_cache.set((team_id, missing[team_id]), roster, ttl=ttl)
+            rosters[team_id] = roster
+
+    return rosters
@@ -1,5 +1,6 @@
 from app.extensions import db
 from .models import User
+from app.modules.teams.services import TeamService
 from .utils import hash_password, check_password, generate_access_token
 from .exceptions import UserAlreadyExistsError,UserNotFoundError,InvalidCredentialsError
 
@@ -75,8 +76,10 @@ class AuthService:
         if not user:
             raise UserNotFoundError("User not found.")
         
-        if data.get("name"):
+        if data.get("name") and data["name"] != user.name:
             user.name = data["name"]
+            # Cached team rosters render member names
+            TeamService.bump_roster_versions(member_id=user.id)
         if data.get("email"):
             user.email = data["email"]
         if data.get("password"):
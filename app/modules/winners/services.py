@@ -4,6 +4,7 @@ from app.extensions import db
 from app.modules.winners.models import Winner
 from app.modules.submissions.models import ProjectSubmission
 from app.modules.submissions.services import ScoringService
+from app.modules.teams.utils import team_load_options, get_rosters
 
 
 class WinnerService:
@@ -13,23 +14,14 @@ class WinnerService:
         # if hackathon.is_finalized:
         #     raise BadRequest("Hackathon already finalized")
 
-        submissions = ProjectSubmission.query.filter_by(
-            hackathon_id=hackathon.id
-        ).all()
+        ranked = ScoringService.rank_submissions(hackathon.id)
 
-        if not submissions:
+        if not ranked:
             raise BadRequest("No submissions to finalize")
 
-        ranked = sorted(
-            submissions,
-            key=lambda s: ScoringService.calculate_average(s) or 0,
-            reverse=True
-        )
-
         winners = []
 
-        for position, submission in enumerate(ranked[:3], start=1):
-            avg = ScoringService.calculate_average(submission)
+        for position, (submission, avg) in enumerate(ranked[:3], start=1):
             if avg is None:
                 continue
 
@@ -50,12 +42,17 @@ class WinnerService:
     def list_winners(hackathon_id):
         winners = (
             Winner.query
+            .options(*team_load_options("bare", via=(Winner.project, ProjectSubmission.team)))
             .join(ProjectSubmission)
             .filter(ProjectSubmission.hackathon_id == hackathon_id)
             .order_by(Winner.position)
             .all()
         )
 
+        rosters = get_rosters(w.project.team for w in winners)
+        scores = ScoringService.score_summary(
+            submission_ids=[w.project_id for w in winners]
+        )
         response = []
 
         for w in winners:
@@ -65,7 +62,7 @@ class WinnerService:
             response.append({
                 "id": w.id,
                 "position": w.position,
-                "score": ScoringService.calculate_average(submission),
+                "score": scores.get(submission.id, {}).get("average"),
                 "project": {
                     "id": submission.id,
                     "title": submission.project_title,
@@ -77,11 +74,11 @@ class WinnerService:
                     "name": team.name,
                     "members": [
                         {
-                            "user_id": m.member_id,
-                            "name": m.user.name,
-                            "role": m.role.value
+                            "user_id": m["member_id"],
+                            "name": m["name"],
+                            "role": m["role"]
                         }
-                        for m in team.members
+                        for m in rosters[team.id]
                     ]
                 },
                 "created_at": w.created_at.isoformat()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from flask_migrate import upgrade
+from sqlalchemy import event
+
+from app.config.settings import Config
+from app.extensions import db
+from app.main import create_app
+
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+
+
+@contextmanager
+def bench_app():
+    """App context on a throwaway, fully migrated SQLite file; schedulers off."""
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        Config.SECRET_KEY = Config.SECRET_KEY or "benchmark-secret-key-of-32-bytes"
+        Config.TESTING = True
+
+        app = create_app()
+        with app.app_context():
+            upgrade(directory=MIGRATIONS)
+            yield app
+            db.session.remove()
+
+
+def best_of(fn, repeat=5) -> float:
+    """Seconds of the fastest of ``repeat`` calls, after one warm-up call."""
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@contextmanager
+def count_queries():
+    """Yields a one-item list holding the number of statements executed."""
+    counter = [0]
+
+    def count(*args):
+        counter[0] += 1
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
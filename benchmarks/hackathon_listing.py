@@ -0,0 +1,89 @@
+"""
+Rows per second of the /hackathon/all serialization paths:
+
+    python -m benchmarks.hackathon_listing [--rows 10000]
+
+"orm + from_orm" is the path listings used before: hydrated Hackathon
+objects through HackathonResponse.from_orm. The projected paths select
+LISTING_COLUMNS[view] as plain rows and validate them with the
+HACKATHON_LIST_ADAPTERS TypeAdapters, as the route does now.
+"""
+import argparse
+import uuid
+from datetime import datetime, timedelta
+
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon
+from app.modules.hackathons.schemas import HackathonResponse, HACKATHON_LIST_ADAPTERS
+from app.modules.hackathons.services import LISTING_COLUMNS
+from app.modules.users.models import User
+
+from .common import bench_app, best_of
+
+
+def seed(rows: int) -> None:
+    organizer = User(name="organizer", email="organizer@example.com", password_hash="x")
+    db.session.add(organizer)
+    db.session.flush()
+
+    now = datetime.utcnow()
+    db.session.bulk_insert_mappings(Hackathon, [
+        dict(
+            id=str(uuid.uuid4()),
+            organizer_id=str(organizer.id),
+            event_name=f"Event {i}",
+            description="lorem ipsum " * 200,
+            location="Pune",
+            mode="online",
+            participation_type="individual",
+            entry_fee=0,
+            tags=["ai", "web"],
+            interested_count=0,
+            status="upcoming",
+            requirements=["laptop"] * 10,
+            prizes=["cash"] * 10,
+            created_at=now - timedelta(seconds=i),
+        )
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def orm_from_orm():
+    db.session.expunge_all()
+    hackathons = Hackathon.query.order_by(Hackathon.created_at.desc()).all()
+    return [HackathonResponse.from_orm(h).dict() for h in hackathons]
+
+
+def projected(view):
+    rows = (
+        Hackathon.query
+        .with_entities(*LISTING_COLUMNS[view])
+        .order_by(Hackathon.created_at.desc())
+        .all()
+    )
+    adapter = HACKATHON_LIST_ADAPTERS[view]
+    return adapter.dump_python(adapter.validate_python([r._asdict() for r in rows]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with bench_app():
+        seed(args.rows)
+
+        # The fast path must not change the default payload
+        assert orm_from_orm() == projected("full")
+
+        for name, fn in (
+            ("orm + from_orm", orm_from_orm),
+            ("projected full", lambda: projected("full")),
+            ("projected summary", lambda: projected("summary")),
+        ):
+            print(f"{name:20s} {args.rows / best_of(fn):10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
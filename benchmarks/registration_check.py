@@ -0,0 +1,112 @@
+"""
+Cost of "am I registered?" on team events as the number of teams grows:
+
+    python -m benchmarks.registration_check [--teams 10 100 1000 3000]
+
+Every event gets N registered teams of three members. The check runs for
+a member of the last team and for a user in no team, with the per-user
+registration cache cleared each time, and reports statements and time.
+"""
+import argparse
+import uuid
+from datetime import datetime
+
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon
+from app.modules.registration.model import HackathonRegistration
+from app.modules.registration.services import RegistrationService
+from app.modules.registration.utils import registration_cache
+from app.modules.teams.models import HackathonTeam, HackathonTeamMember, TeamMemberRole
+from app.modules.users.models import User
+
+from .common import bench_app, best_of, count_queries
+
+
+TEAM_SIZE = 3
+
+
+def add_users(count: int) -> list[int]:
+    marker = uuid.uuid4().hex[:8]
+    db.session.bulk_insert_mappings(User, [
+        dict(name=f"user{marker}{i}", email=f"{marker}.{i}@example.com", password_hash="x")
+        for i in range(count)
+    ])
+    db.session.commit()
+    return [
+        user_id for (user_id,) in
+        db.session.query(User.id).filter(User.email.like(f"{marker}.%")).order_by(User.id)
+    ]
+
+
+def seed_event(teams: int, organizer_id: int) -> tuple[str, int]:
+    """A team event with ``teams`` registered teams; returns (id, a member)."""
+    hackathon_id = str(uuid.uuid4())
+    db.session.add(Hackathon(
+        id=hackathon_id,
+        organizer_id=str(organizer_id),
+        event_name=f"Team event with {teams} teams",
+        description="benchmark",
+        mode="online",
+        participation_type="team",
+        min_team_size=1,
+        max_team_size=TEAM_SIZE,
+    ))
+
+    users = add_users(teams * TEAM_SIZE)
+    team_ids = [str(uuid.uuid4()) for _ in range(teams)]
+    now = datetime.utcnow()
+
+    db.session.bulk_insert_mappings(HackathonTeam, [
+        dict(id=team_id, name=f"team {i}", created_by=users[i * TEAM_SIZE],
+             member_count=TEAM_SIZE, created_at=now)
+        for i, team_id in enumerate(team_ids)
+    ])
+    db.session.bulk_insert_mappings(HackathonTeamMember, [
+        dict(id=str(uuid.uuid4()), hackathon_team_id=team_id, member_id=users[i * TEAM_SIZE + j],
+             role=TeamMemberRole.OWNER if j == 0 else TeamMemberRole.MEMBER, joined_at=now)
+        for i, team_id in enumerate(team_ids)
+        for j in range(TEAM_SIZE)
+    ])
+    db.session.bulk_insert_mappings(HackathonRegistration, [
+        dict(id=str(uuid.uuid4()), hackathon_id=hackathon_id, team_id=team_id,
+             seats=TEAM_SIZE, status="pending", registered_at=now)
+        for team_id in team_ids
+    ])
+    db.session.commit()
+    return hackathon_id, users[-1]
+
+
+def measure(hackathon_id: str, user_id: int) -> tuple[int, float, bool]:
+    def check():
+        registration_cache.clear()
+        return RegistrationService.check_user_registration(hackathon_id, user_id)
+
+    with count_queries() as queries:
+        registered = check()["registered"]
+    return queries[0], best_of(check, repeat=20), registered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, nargs="+", default=[10, 100, 1000, 3000])
+    args = parser.parse_args()
+
+    with bench_app():
+        organizer, outsider = add_users(2)
+
+        print(f"{'teams':>6}  {'member: queries':>15} {'ms':>7}  {'outsider: queries':>17} {'ms':>7}")
+        for teams in args.teams:
+            hackathon_id, member = seed_event(teams, organizer)
+
+            member_queries, member_time, registered = measure(hackathon_id, member)
+            outsider_queries, outsider_time, _ = measure(hackathon_id, outsider)
+            assert registered
+
+            print(
+                f"{teams:>6}  {member_queries:>15} {member_time * 1000:>7.2f}"
+                f"  {outsider_queries:>17} {outsider_time * 1000:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
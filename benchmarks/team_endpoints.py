@@ -0,0 +1,142 @@
+"""
+Statements and latency of the endpoints that render teams and rosters:
+
+    python -m benchmarks.team_endpoints [--iterations 30]
+
+Seeds one team event with 8 registered teams of 5 members, a submission
+per team and three winners. For every endpoint it reports the statements
+of the first request and the mean time of the following ones. Run it on
+both sides of a loading change (e.g. from a worktree of the parent
+commit) to compare.
+"""
+import argparse
+import time
+import uuid
+
+from flask_jwt_extended import create_access_token
+
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon
+from app.modules.registration.model import HackathonRegistration
+from app.modules.registration.utils import registration_cache
+from app.modules.submissions.models import ProjectSubmission
+from app.modules.teams.models import HackathonTeam, HackathonTeamMember, TeamMemberRole
+from app.modules.users.models import User
+from app.modules.winners.models import Winner
+
+from .common import bench_app, count_queries
+
+
+TEAMS = 8
+TEAM_SIZE = 5
+
+
+def seed() -> dict:
+    users = [
+        User(name=f"member{i:02d}", email=f"member{i:02d}@example.com", password_hash="x")
+        for i in range(TEAMS * TEAM_SIZE + 2)
+    ]
+    db.session.add_all(users)
+    db.session.flush()
+    organizer, extra, members = users[0], users[1], users[2:]
+
+    hackathon = Hackathon(
+        id=str(uuid.uuid4()),
+        organizer_id=str(organizer.id),
+        event_name="Benchmark team event",
+        description="benchmark",
+        mode="online",
+        participation_type="team",
+        min_team_size=1,
+        max_team_size=TEAM_SIZE + 1,
+    )
+    db.session.add(hackathon)
+
+    teams, submissions = [], []
+    for i in range(TEAMS):
+        roster = members[i * TEAM_SIZE:(i + 1) * TEAM_SIZE]
+        team = HackathonTeam(name=f"team {i}", created_by=roster[0].id, member_count=TEAM_SIZE)
+        db.session.add(team)
+        db.session.flush()
+        db.session.add_all(
+            HackathonTeamMember(
+                hackathon_team_id=team.id,
+                member_id=user.id,
+                role=TeamMemberRole.OWNER if j == 0 else TeamMemberRole.MEMBER
+            )
+            for j, user in enumerate(roster)
+        )
+        db.session.add(HackathonRegistration(hackathon_id=hackathon.id, team_id=team.id, seats=TEAM_SIZE))
+        submission = ProjectSubmission(
+            hackathon_id=hackathon.id, team_id=team.id,
+            project_title=f"project {i}", project_desc="benchmark", github_url="https://example.com"
+        )
+        db.session.add(submission)
+        teams.append((team.id, roster[0].id))
+        submissions.append(submission)
+
+    db.session.flush()
+    db.session.add_all(
+        Winner(project_id=submission.id, position=position)
+        for position, submission in enumerate(submissions[:3], start=1)
+    )
+    db.session.commit()
+
+    return {
+        "hackathon": hackathon.id,
+        "organizer": organizer.id,
+        "extra": extra.id,
+        "member": members[3].id,
+        "team": teams[0][0],
+        "owner": teams[0][1],
+        "submission": submissions[0].id,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    with bench_app() as app:
+        ids = seed()
+        db.session.remove()
+        client = app.test_client()
+
+        def auth(user_id):
+            return {"Authorization": f"Bearer {create_access_token(identity=str(user_id))}"}
+
+        owner, organizer = auth(ids["owner"]), auth(ids["organizer"])
+        team, hackathon = ids["team"], ids["hackathon"]
+
+        def member_round_trip():
+            client.post(f"/team/{team}/members", json={"member_id": ids["extra"]}, headers=owner)
+            client.delete(f"/team/{team}/members/{ids['extra']}", headers=owner)
+
+        def cold_check():
+            registration_cache.clear()
+            client.get(f"/register/check/{hackathon}", headers=auth(ids["member"]))
+
+        endpoints = (
+            ("POST+DELETE /team/<id>/members", member_round_trip),
+            ("GET /team/<id>", lambda: client.get(f"/team/{team}", headers=owner)),
+            ("GET /team/my-teams", lambda: client.get("/team/my-teams", headers=owner)),
+            ("GET /register/hackathon/<id>", lambda: client.get(f"/register/hackathon/{hackathon}", headers=organizer)),
+            ("GET /register/check/<id> (cold)", cold_check),
+            ("GET /submissions/hackathons/<id>", lambda: client.get(f"/submissions/hackathons/{hackathon}", headers=organizer)),
+            ("GET /submissions/<id>", lambda: client.get(f"/submissions/{ids['submission']}", headers=organizer)),
+            ("GET /winners/hackathons/<id>", lambda: client.get(f"/winners/hackathons/{hackathon}", headers=organizer)),
+        )
+
+        for label, request in endpoints:
+            with count_queries() as queries:
+                request()
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                request()
+            elapsed = (time.perf_counter() - started) / args.iterations
+            print(f"{label:34s} queries {queries[0]:3d}  {elapsed * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""hackathon keyset pagination index
+
+Revision ID: 3f1c2a9d8b17
+Revises: be7ccac4ac06
+Create Date: 2026-10-18 09:12:44.201337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d8b17'
+down_revision = 'be7ccac4ac06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_hackathons_created_at_id', 'hackathons', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_hackathons_created_at_id', table_name='hackathons')
@@ -0,0 +1,24 @@
+"""team member lookup index
+
+Revision ID: 4b8e2d7f0a91
+Revises: 91d0c6f3a8e2
+Create Date: 2026-10-18 12:48:13.095526
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8e2d7f0a91'
+down_revision = '91d0c6f3a8e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_team_members_member_team', 'hackathon_team_members', ['member_id', 'hackathon_team_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_team_members_member_team', table_name='hackathon_team_members')
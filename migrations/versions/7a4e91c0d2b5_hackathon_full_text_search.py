@@ -0,0 +1,56 @@
+"""hackathon full text search
+
+Revision ID: 7a4e91c0d2b5
+Revises: 3f1c2a9d8b17
+Create Date: 2026-10-18 10:03:19.554120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a4e91c0d2b5'
+down_revision = '3f1c2a9d8b17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # Generated column: Postgres keeps it in sync on every insert/update
+        op.execute(
+            "ALTER TABLE hackathons ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(event_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+            ") STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_hackathons_search_vector ON hackathons USING GIN (search_vector)"
+        )
+
+    elif dialect == 'sqlite':
+        # FTS5 shadow table, maintained by HackathonSearch.index/remove
+        op.execute(
+            "CREATE VIRTUAL TABLE hackathons_fts USING fts5("
+            "hackathon_id UNINDEXED, event_name, description, location)"
+        )
+        op.execute(
+            "INSERT INTO hackathons_fts (hackathon_id, event_name, description, location) "
+            "SELECT id, event_name, description, location FROM hackathons"
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_hackathons_search_vector")
+        op.execute("ALTER TABLE hackathons DROP COLUMN IF EXISTS search_vector")
+
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS hackathons_fts")
@@ -0,0 +1,33 @@
+"""hackathon interest deltas
+
+Revision ID: 91d0c6f3a8e2
+Revises: e2b7f4a19c63
+Create Date: 2026-10-18 12:05:41.772390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '91d0c6f3a8e2'
+down_revision = 'e2b7f4a19c63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('hackathon_interest_deltas',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('hackathon_id', sa.String(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_hackathon_interest_deltas_hackathon_id'), 'hackathon_interest_deltas', ['hackathon_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_hackathon_interest_deltas_hackathon_id'), table_name='hackathon_interest_deltas')
+    op.drop_table('hackathon_interest_deltas')
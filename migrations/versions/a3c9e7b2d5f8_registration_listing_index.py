@@ -0,0 +1,24 @@
+"""registration listing index
+
+Revision ID: a3c9e7b2d5f8
+Revises: d6a1f5c8e3b4
+Create Date: 2026-10-18 13:58:02.417736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e7b2d5f8'
+down_revision = 'd6a1f5c8e3b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_registrations_hackathon_registered_at', 'hackathon_registrations', ['hackathon_id', 'registered_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_registrations_hackathon_registered_at', table_name='hackathon_registrations')
@@ -0,0 +1,26 @@
+"""team roster version
+
+Revision ID: a9c3e5f1d7b4
+Revises: e4a7c2f9b1d6
+Create Date: 2026-10-18 16:14:26.573190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c3e5f1d7b4'
+down_revision = 'e4a7c2f9b1d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('hackathon_teams', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('roster_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('hackathon_teams', schema=None) as batch_op:
+        batch_op.drop_column('roster_version')
@@ -0,0 +1,27 @@
+"""drop registration_stats.total_participants
+
+Revision ID: b5e2d9c4a7f1
+Revises: f3c8a1d5e9b2
+Create Date: 2026-10-18 17:21:48.915530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e2d9c4a7f1'
+down_revision = 'f3c8a1d5e9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Analytics reads hackathons.participant_count; this copy only drifted
+    with op.batch_alter_table('registration_stats', schema=None) as batch_op:
+        batch_op.drop_column('total_participants')
+
+
+def downgrade():
+    with op.batch_alter_table('registration_stats', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_participants', sa.Integer(), server_default='0', nullable=False))
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""registration tickets
+
+Revision ID: b8d2f6e0c4a7
+Revises: f7e3a0b6c2d9
+Create Date: 2026-10-18 15:02:13.604728
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d2f6e0c4a7'
+down_revision = 'f7e3a0b6c2d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('registration_tickets',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('hackathon_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('team_id', sa.String(), nullable=True),
+    sa.Column('status', sa.Enum('queued', 'registered', 'waitlisted', 'failed', name='registration_ticket_status'), nullable=False),
+    sa.Column('registration_id', sa.String(), nullable=True),
+    sa.Column('message', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['team_id'], ['hackathon_teams.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('registration_tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_registration_tickets_status_created_at', ['status', 'created_at'], unique=False)
+        batch_op.create_index('ix_registration_tickets_hackathon_status', ['hackathon_id', 'status', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('registration_tickets', schema=None) as batch_op:
+        batch_op.drop_index('ix_registration_tickets_hackathon_status')
+        batch_op.drop_index('ix_registration_tickets_status_created_at')
+
+    op.drop_table('registration_tickets')
+    sa.Enum(name='registration_ticket_status').drop(op.get_bind(), checkfirst=True)
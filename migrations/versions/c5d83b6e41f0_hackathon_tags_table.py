@@ -0,0 +1,49 @@
+"""hackathon tags table
+
+Revision ID: c5d83b6e41f0
+Revises: 7a4e91c0d2b5
+Create Date: 2026-10-18 10:41:52.873015
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d83b6e41f0'
+down_revision = '7a4e91c0d2b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    hackathon_tags = op.create_table('hackathon_tags',
+    sa.Column('hackathon_id', sa.String(), nullable=False),
+    sa.Column('tag', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('hackathon_id', 'tag')
+    )
+    op.create_index('ix_hackathon_tags_tag_hackathon_id', 'hackathon_tags', ['tag', 'hackathon_id'], unique=False)
+
+    # Backfill from the JSON column
+    hackathons = sa.table('hackathons', sa.column('id', sa.String()), sa.column('tags', sa.JSON()))
+    rows = []
+    for hackathon_id, tags in op.get_bind().execute(sa.select(hackathons.c.id, hackathons.c.tags)):
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+        seen = set()
+        for tag in tags or []:
+            tag = str(tag).strip()[:100]
+            if tag and tag not in seen:
+                seen.add(tag)
+                rows.append({'hackathon_id': hackathon_id, 'tag': tag})
+
+    if rows:
+        op.bulk_insert(hackathon_tags, rows)
+
+
+def downgrade():
+    op.drop_index('ix_hackathon_tags_tag_hackathon_id', table_name='hackathon_tags')
+    op.drop_table('hackathon_tags')
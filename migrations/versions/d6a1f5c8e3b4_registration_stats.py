@@ -0,0 +1,35 @@
+"""registration stats
+
+Revision ID: d6a1f5c8e3b4
+Revises: 4b8e2d7f0a91
+Create Date: 2026-10-18 13:21:37.640182
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6a1f5c8e3b4'
+down_revision = '4b8e2d7f0a91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows are seeded lazily by RegistrationService._ensure_stats
+    op.create_table('registration_stats',
+    sa.Column('hackathon_id', sa.String(), nullable=False),
+    sa.Column('total_registrations', sa.Integer(), nullable=False),
+    sa.Column('pending', sa.Integer(), nullable=False),
+    sa.Column('approved', sa.Integer(), nullable=False),
+    sa.Column('rejected', sa.Integer(), nullable=False),
+    sa.Column('total_participants', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('hackathon_id')
+    )
+
+
+def downgrade():
+    op.drop_table('registration_stats')
@@ -0,0 +1,24 @@
+"""judge_scores (submission_id, score) index
+
+Revision ID: d6b1e8a4f2c7
+Revises: a9c3e5f1d7b4
+Create Date: 2026-10-18 16:42:51.208437
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6b1e8a4f2c7'
+down_revision = 'a9c3e5f1d7b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_judge_scores_submission_score', 'judge_scores', ['submission_id', 'score'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_judge_scores_submission_score', table_name='judge_scores')
\ No newline at end of file
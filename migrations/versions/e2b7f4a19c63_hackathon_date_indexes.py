@@ -0,0 +1,26 @@
+"""hackathon start/end date indexes
+
+Revision ID: e2b7f4a19c63
+Revises: c5d83b6e41f0
+Create Date: 2026-10-18 11:27:06.310948
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b7f4a19c63'
+down_revision = 'c5d83b6e41f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_hackathons_start_date', 'hackathons', ['start_date'], unique=False)
+    op.create_index('ix_hackathons_end_date', 'hackathons', ['end_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_hackathons_end_date', table_name='hackathons')
+    op.drop_index('ix_hackathons_start_date', table_name='hackathons')
@@ -0,0 +1,48 @@
+"""team member and hackathon participant counts
+
+Revision ID: e4a7c2f9b1d6
+Revises: c1f4a8d3e6b2
+Create Date: 2026-10-18 15:51:08.340217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a7c2f9b1d6'
+down_revision = 'c1f4a8d3e6b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('hackathon_teams', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('hackathons', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('participant_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        "UPDATE hackathon_teams SET member_count = ("
+        "SELECT count(*) FROM hackathon_team_members "
+        "WHERE hackathon_team_members.hackathon_team_id = hackathon_teams.id"
+        ")"
+    )
+    op.execute(
+        "UPDATE hackathons SET participant_count = ("
+        "SELECT coalesce(sum(CASE WHEN hackathon_registrations.user_id IS NOT NULL THEN 1 "
+        "ELSE coalesce(hackathon_teams.member_count, 0) END), 0) "
+        "FROM hackathon_registrations "
+        "LEFT OUTER JOIN hackathon_teams ON hackathon_teams.id = hackathon_registrations.team_id "
+        "WHERE hackathon_registrations.hackathon_id = hackathons.id"
+        ")"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('hackathons', schema=None) as batch_op:
+        batch_op.drop_column('participant_count')
+
+    with op.batch_alter_table('hackathon_teams', schema=None) as batch_op:
+        batch_op.drop_column('member_count')
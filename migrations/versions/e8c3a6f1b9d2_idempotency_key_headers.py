@@ -0,0 +1,26 @@
+"""idempotency key headers
+
+Revision ID: e8c3a6f1b9d2
+Revises: b5e2d9c4a7f1
+Create Date: 2026-10-18 17:48:12.604731
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8c3a6f1b9d2'
+down_revision = 'b5e2d9c4a7f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('headers', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_column('headers')
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""participant_count excludes rejected registrations
+
+Revision ID: f3c8a1d5e9b2
+Revises: d6b1e8a4f2c7
+Create Date: 2026-10-18 17:05:12.640318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a1d5e9b2'
+down_revision = 'd6b1e8a4f2c7'
+branch_labels = None
+depends_on = None
+
+
+def _recount(status_filter):
+    op.execute(
+        "UPDATE hackathons SET participant_count = ("
+        "SELECT coalesce(sum(CASE WHEN hackathon_registrations.user_id IS NOT NULL THEN 1 "
+        "ELSE coalesce(hackathon_teams.member_count, 0) END), 0) "
+        "FROM hackathon_registrations "
+        "LEFT OUTER JOIN hackathon_teams ON hackathon_teams.id = hackathon_registrations.team_id "
+        "WHERE hackathon_registrations.hackathon_id = hackathons.id" + status_filter +
+        ")"
+    )
+
+
+def upgrade():
+    _recount(" AND hackathon_registrations.status != 'rejected'")
+
+
+def downgrade():
+    _recount("")
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""hackathon seats taken
+
+Revision ID: f7e3a0b6c2d9
+Revises: a3c9e7b2d5f8
+Create Date: 2026-10-18 14:36:55.281904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7e3a0b6c2d9'
+down_revision = 'a3c9e7b2d5f8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('hackathons', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('seats_taken', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('hackathon_registrations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('seats', sa.Integer(), server_default='1', nullable=False))
+
+    # Team registrations hold one seat per current member
+    op.execute(
+        "UPDATE hackathon_registrations SET seats = ("
+        "SELECT count(*) FROM hackathon_team_members "
+        "WHERE hackathon_team_members.hackathon_team_id = hackathon_registrations.team_id"
+        ") WHERE team_id IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE hackathons SET seats_taken = ("
+        "SELECT coalesce(sum(seats), 0) FROM hackathon_registrations "
+        "WHERE hackathon_registrations.hackathon_id = hackathons.id "
+        "AND hackathon_registrations.status != 'rejected'"
+        ")"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('hackathon_registrations', schema=None) as batch_op:
+        batch_op.drop_column('seats')
+
+    with op.batch_alter_table('hackathons', schema=None) as batch_op:
+        batch_op.drop_column('seats_taken')
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+from flask_jwt_extended import create_access_token
+from flask_migrate import upgrade
+from sqlalchemy import event
+
+from app.config.settings import Config
+from app.extensions import db
+from app.main import create_app
+from app.modules.hackathons.utils import catalog_cache, response_cache
+from app.modules.registration.utils import registration_cache
+from app.modules.teams.utils import roster_cache
+
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # A file database, so worker threads in concurrency tests share it
+    monkeypatch.setattr(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(Config, "SECRET_KEY", "test-secret-key-of-at-least-32-bytes")
+    monkeypatch.setattr(Config, "BCRYPT_LOG_ROUNDS", 4, raising=False)
+    # TESTING keeps create_app from starting the background schedulers
+    monkeypatch.setattr(Config, "TESTING", True, raising=False)
+
+    app = create_app()
+
+    # Process-wide caches are keyed by ids that repeat across test databases
+    for cache in (catalog_cache, response_cache, registration_cache, roster_cache):
+        cache.clear()
+
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth(app):
+    def headers(user_id):
+        return {"Authorization": f"Bearer {create_access_token(identity=str(user_id))}"}
+    return headers
+
+
+@pytest.fixture
+def make_user(client):
+    def make(name):
+        response = client.post("/auth/register", json={
+            "name": name,
+            "email": f"{name}@example.com",
+            "password": "password1"
+        })
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()["user"]["id"]
+    return make
+
+
+@pytest.fixture
+def make_hackathon(client, auth):
+    def make(organizer_id, event_name, **fields):
+        payload = {
+            "event_name": event_name,
+            "description": "An event for tests",
+            "mode": "online",
+            "participation_type": "individual",
+            "location": None,
+            "min_team_size": None,
+            "max_team_size": None,
+            "max_participants": None,
+            "deadline": None,
+            "start_date": None,
+            "end_date": None,
+            **fields
+        }
+        response = client.post("/hackathon/create", json=payload, headers=auth(organizer_id))
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()["id"]
+    return make
+
+
+@pytest.fixture
+def make_team(client, auth):
+    def make(owner_id, name, member_ids=()):
+        response = client.post("/team/create", json={"name": name}, headers=auth(owner_id))
+        assert response.status_code == 201, response.get_json()
+        team_id = response.get_json()["id"]
+        for member_id in member_ids:
+            added = client.post(
+                f"/team/{team_id}/members", json={"member_id": member_id}, headers=auth(owner_id)
+            )
+            assert added.status_code == 201, added.get_json()
+        return team_id
+    return make
+
+
+class QueryCounter:
+    """Counts statements sent to the database inside a ``with`` block."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+@pytest.fixture
+def count_queries(app):
+    return lambda: QueryCounter(db.engine)
@@ -0,0 +1,288 @@
+from datetime import datetime, timedelta
+
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon, HackathonInterestDelta, HackathonTag
+from app.modules.hackathons.services import HackathonService
+
+
+def test_ranked_search_page_has_no_handover_cursor(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    for name in ("Robotics cup", "Robotics open", "Robotics robotics derby"):
+        make_hackathon(organizer, name, description="robotics")
+
+    page = client.get("/hackathon/all?search=robotics&limit=1").get_json()
+
+    assert page["has_more"] is True
+    assert page["next_cursor"] is None
+
+
+def test_zero_limit_cursor_page_is_not_an_error(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    make_hackathon(organizer, "First event")
+    make_hackathon(organizer, "Second event")
+
+    response = client.get("/hackathon/all?cursor=&limit=0")
+
+    assert response.status_code == 200
+    assert len(response.get_json()["results"]) == 1
+
+
+def test_zero_or_negative_limit_offset_page_is_not_an_error(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    make_hackathon(organizer, "First event")
+    make_hackathon(organizer, "Second event")
+
+    for limit in (0, -3):
+        response = client.get(f"/hackathon/all?limit={limit}")
+        assert response.status_code == 200
+        assert response.get_json()["limit"] == 1
+        assert len(response.get_json()["results"]) == 1
+
+
+def _listed_names(client, query):
+    results = client.get(f"/hackathon/all?limit=50&{query}").get_json()["results"]
+    return sorted(data["event_name"] for data in results)
+
+
+def test_tag_filter_matches_any_by_default_and_all_on_request(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    make_hackathon(organizer, "Both tags", tags=["ai", "web"])
+    make_hackathon(organizer, "Only ai", tags=["ai"])
+    make_hackathon(organizer, "Only web", tags=["web"])
+    make_hackathon(organizer, "Untagged")
+
+    assert _listed_names(client, "tag=ai") == ["Both tags", "Only ai"]
+    assert _listed_names(client, "tag=ai,web") == ["Both tags", "Only ai", "Only web"]
+    assert _listed_names(client, "tag=ai,%20web%20&tag_match=all") == ["Both tags"]
+
+
+def test_tags_are_normalized_on_create_and_update(client, auth, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Tagged event", tags=[" ai ", "ai", "", "web"])
+
+    def mirrored():
+        rows = HackathonTag.query.filter_by(hackathon_id=hackathon_id).all()
+        return sorted(row.tag for row in rows)
+
+    assert mirrored() == ["ai", "web"]
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["tags"] == ["ai", "web"]
+    assert _listed_names(client, "tag=ai") == ["Tagged event"]
+
+    response = client.put(
+        f"/hackathon/{hackathon_id}", json={"tags": ["ml ", "web", "ml"]}, headers=auth(organizer)
+    )
+    assert response.get_json()["tags"] == ["ml", "web"]
+    assert mirrored() == ["ml", "web"]
+    assert _listed_names(client, "tag=ai") == []
+    assert _listed_names(client, "tag=ml") == ["Tagged event"]
+
+
+def _stored_interest(hackathon_id):
+    db.session.expire_all()
+    return db.session.get(Hackathon, hackathon_id).interested_count
+
+
+def test_atomic_interest_toggle_moves_the_stored_count(client, auth, make_user, make_hackathon):
+    organizer, fan, other = make_user("organizer"), make_user("firstfan"), make_user("secondfan")
+    hackathon_id = make_hackathon(organizer, "Hot event")
+
+    def toggle(user_id):
+        return client.post(f"/hackathon/interest/{hackathon_id}", headers=auth(user_id)).get_json()
+
+    assert toggle(fan) == {"interested_count": 1, "is_interested": True}
+    assert toggle(other) == {"interested_count": 2, "is_interested": True}
+    assert _stored_interest(hackathon_id) == 2
+
+    assert toggle(fan) == {"interested_count": 1, "is_interested": False}
+    assert toggle(other) == {"interested_count": 0, "is_interested": False}
+    assert _stored_interest(hackathon_id) == 0
+    assert HackathonInterestDelta.query.count() == 0
+
+
+def test_write_behind_interest_is_folded_by_flush(app, client, auth, make_user, make_hackathon):
+    app.config["HACKATHON_INTEREST_COUNTER"] = "write_behind"
+    organizer, fan, other = make_user("organizer"), make_user("firstfan"), make_user("secondfan")
+    hackathon_id = make_hackathon(organizer, "Hot event")
+
+    client.post(f"/hackathon/interest/{hackathon_id}", headers=auth(fan))
+    toggled = client.post(f"/hackathon/interest/{hackathon_id}", headers=auth(other)).get_json()
+
+    # Pending deltas are counted before they reach the row
+    assert toggled["interested_count"] == 2
+    assert _stored_interest(hackathon_id) == 0
+
+    assert HackathonService.flush_interest_deltas() == 2
+    assert _stored_interest(hackathon_id) == 2
+    assert HackathonInterestDelta.query.count() == 0
+
+    client.post(f"/hackathon/interest/{hackathon_id}", headers=auth(fan))
+    HackathonService.flush_interest_deltas()
+    assert _stored_interest(hackathon_id) == 1
+
+
+def test_reconcile_fixes_drift_and_keeps_pending_deltas(app, client, auth, make_user, make_hackathon):
+    app.config["HACKATHON_INTEREST_COUNTER"] = "write_behind"
+    organizer, fan, other = make_user("organizer"), make_user("firstfan"), make_user("secondfan")
+    drifted = make_hackathon(organizer, "Drifted event")
+    steady = make_hackathon(organizer, "Steady event")
+
+    client.post(f"/hackathon/interest/{drifted}", headers=auth(fan))
+    client.post(f"/hackathon/interest/{steady}", headers=auth(fan))
+    HackathonService.flush_interest_deltas()
+
+    # One toggle still pending in the log, and a counter that drifted
+    client.post(f"/hackathon/interest/{drifted}", headers=auth(other))
+    Hackathon.query.filter_by(id=drifted).update({Hackathon.interested_count: 9})
+    db.session.commit()
+    assert client.get(f"/hackathon/view/{drifted}").get_json()["interested_count"] == 9
+    assert client.get(f"/hackathon/view/{steady}").get_json()["event_name"] == "Steady event"
+    _rename_behind_the_cache(steady, "Steady renamed")
+
+    assert HackathonService.reconcile_interest_counts(chunk_size=1) == 1
+    # Only the corrected event's cached page is dropped
+    assert client.get(f"/hackathon/view/{drifted}").get_json()["interested_count"] == 1
+    assert client.get(f"/hackathon/view/{steady}").get_json()["event_name"] == "Steady event"
+    assert _stored_interest(drifted) == 1
+    assert _stored_interest(steady) == 1
+    assert HackathonInterestDelta.query.count() == 1
+
+    HackathonService.flush_interest_deltas()
+    assert _stored_interest(drifted) == 2
+
+
+def test_matching_etag_returns_304(client, make_user, make_hackathon):
+    hackathon_id = make_hackathon(make_user("organizer"), "Tagged event")
+
+    first = client.get(f"/hackathon/view/{hackathon_id}")
+    assert first.status_code == 200 and first.headers["ETag"]
+
+    again = client.get(f"/hackathon/view/{hackathon_id}", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.get_data() == b""
+
+    stale = client.get(f"/hackathon/view/{hackathon_id}", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+
+
+def _rename_behind_the_cache(hackathon_id, name):
+    Hackathon.query.filter_by(id=hackathon_id).update({Hackathon.event_name: name})
+    db.session.commit()
+
+
+def test_authenticated_requests_bypass_the_response_cache(client, auth, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Original name")
+
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["event_name"] == "Original name"
+    _rename_behind_the_cache(hackathon_id, "Renamed event")
+
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["event_name"] == "Original name"
+    signed_in = client.get(f"/hackathon/view/{hackathon_id}", headers=auth(organizer)).get_json()
+    assert signed_in["event_name"] == "Renamed event"
+
+
+def test_counter_change_evicts_only_pages_showing_the_event(client, auth, make_user, make_hackathon):
+    organizer, fan = make_user("organizer"), make_user("eventfan")
+    busy = make_hackathon(organizer, "Busy event")
+    quiet = make_hackathon(organizer, "Quiet event")
+
+    for path in (f"/hackathon/view/{busy}", f"/hackathon/view/{quiet}",
+                 "/hackathon/all?limit=1", "/hackathon/all?limit=2"):
+        client.get(path)
+    # The newest event is the only one on the one-row listing page
+    _rename_behind_the_cache(quiet, "Quiet renamed")
+    _rename_behind_the_cache(busy, "Busy renamed")
+
+    client.post(f"/hackathon/interest/{busy}", headers=auth(fan))
+
+    assert client.get(f"/hackathon/view/{busy}").get_json()["interested_count"] == 1
+    assert client.get(f"/hackathon/view/{quiet}").get_json()["event_name"] == "Quiet event"
+    listing = client.get("/hackathon/all?limit=1").get_json()["results"]
+    assert [item["event_name"] for item in listing] == ["Quiet event"]
+    listing = client.get("/hackathon/all?limit=2").get_json()["results"]
+    assert [item["event_name"] for item in listing] == ["Quiet renamed", "Busy renamed"]
+
+
+def test_hackathon_write_evicts_listings_and_its_own_page(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    older = make_hackathon(organizer, "Older event")
+    empty_page = "/hackathon/all?tag=robotics"
+
+    for path in (f"/hackathon/view/{older}", "/hackathon/all", empty_page):
+        client.get(path)
+    _rename_behind_the_cache(older, "Older renamed")
+
+    make_hackathon(organizer, "Robotics cup", tags=["robotics"])
+
+    # Listings are dropped even when they showed none of the written events
+    assert [item["event_name"] for item in client.get(empty_page).get_json()["results"]] == ["Robotics cup"]
+    names = [item["event_name"] for item in client.get("/hackathon/all").get_json()["results"]]
+    assert names == ["Robotics cup", "Older renamed"]
+    assert client.get(f"/hackathon/view/{older}").get_json()["event_name"] == "Older event"
+
+
+def test_facets_count_each_field_without_its_own_filter(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    make_hackathon(organizer, "Online solo", tags=["ai", "web"])
+    make_hackathon(
+        organizer, "Online teams", participation_type="team", min_team_size=1, max_team_size=4,
+        status="ongoing", tags=["ai"]
+    )
+    make_hackathon(organizer, "Offline solo", mode="offline", location="Pune", tags=["web"])
+
+    body = client.get("/hackathon/facets?mode=online").get_json()
+    facets = body["facets"]
+
+    assert body["total"] == 2
+    # The selected mode still shows its siblings
+    assert facets["mode"] == {"online": 2, "offline": 1, "hybrid": 0}
+    assert facets["participation_type"] == {"individual": 1, "team": 1}
+    assert facets["status"] == {"upcoming": 1, "ongoing": 1, "completed": 0}
+    assert facets["tags"] == [{"tag": "ai", "count": 2}, {"tag": "web", "count": 1}]
+
+
+def test_facets_tags_limit_is_validated_and_clamped(client, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    make_hackathon(organizer, "Tagged event", tags=["ai", "web"])
+
+    assert client.get("/hackathon/facets?tags_limit=many").status_code == 400
+    assert len(client.get("/hackathon/facets?tags_limit=0").get_json()["facets"]["tags"]) == 1
+    assert len(client.get("/hackathon/facets?tags_limit=1000").get_json()["facets"]["tags"]) == 2
+
+
+def test_sweep_moves_statuses_across_date_boundaries(make_user, make_hackathon):
+    organizer = make_user("organizer")
+    now = datetime(2030, 6, 15, 12, 0)
+    day = timedelta(days=1)
+
+    def seeded(name, start, end, status):
+        hackathon_id = make_hackathon(organizer, name, status=status)
+        hackathon = db.session.get(Hackathon, hackathon_id)
+        hackathon.start_date, hackathon.end_date = start, end
+        db.session.commit()
+        return hackathon_id
+
+    ended = seeded("Ended event", now - 3 * day, now - day, "ongoing")
+    started = seeded("Started event", now - day, now + day, "upcoming")
+    # Boundaries are inclusive for "ongoing"
+    ends_now = seeded("Ends right now", now - day, now, "upcoming")
+    moved_out = seeded("Moved out event", now + day, now + 2 * day, "ongoing")
+    settled = seeded("Settled event", now + day, now + 2 * day, "upcoming")
+    undated = make_hackathon(organizer, "Undated event", status="ongoing")
+
+    assert HackathonService.sweep_statuses(now=now) == {"completed": 1, "ongoing": 2, "upcoming": 1}
+
+    db.session.expire_all()
+    statuses = {
+        hackathon_id: db.session.get(Hackathon, hackathon_id).status
+        for hackathon_id in (ended, started, ends_now, moved_out, settled, undated)
+    }
+    assert statuses == {
+        ended: "completed",
+        started: "ongoing",
+        ends_now: "ongoing",
+        moved_out: "upcoming",
+        settled: "upcoming",
+        undated: "ongoing",
+    }
+    assert HackathonService.sweep_statuses(now=now) == {"completed": 0, "ongoing": 0, "upcoming": 0}
@@ -0,0 +1,79 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from app.extensions import db
+from app.modules.idempotency.models import IdempotencyKey
+
+
+def _post_register(client, headers, body, key):
+    return client.post(
+        "/register/",
+        data=body,
+        content_type="application/json",
+        headers={**headers, "Idempotency-Key": key}
+    )
+
+
+def _stale_claim(user_id, key, body, age):
+    fingerprint = hashlib.sha256(b"POST /register/\n" + body.encode()).hexdigest()
+    now = datetime.utcnow()
+    db.session.add(IdempotencyKey(
+        user_id=str(user_id),
+        key=key,
+        fingerprint=fingerprint,
+        created_at=now - age,
+        expires_at=now + timedelta(days=1)
+    ))
+    db.session.commit()
+
+
+def test_mapped_domain_error_is_replayed(client, auth, make_user):
+    user_id = make_user("participant")
+    body = json.dumps({"hackathon_id": "no-such-hackathon"})
+
+    first = _post_register(client, auth(user_id), body, "missing-event")
+    assert first.status_code == 404
+    assert "Idempotent-Replayed" not in first.headers
+
+    retry = _post_register(client, auth(user_id), body, "missing-event")
+    assert retry.status_code == 404
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.get_json() == first.get_json()
+
+
+def test_abandoned_claim_is_reclaimed_after_lease(app, client, auth, make_user, make_hackathon):
+    organizer, user_id = make_user("organizer"), make_user("participant")
+    hackathon_id = make_hackathon(organizer, "Open event")
+    body = json.dumps({"hackathon_id": hackathon_id})
+    lease = timedelta(seconds=app.config["IDEMPOTENCY_LEASE"])
+
+    # A request still inside its lease keeps the key locked
+    _stale_claim(user_id, "running", body, age=lease / 2)
+    assert _post_register(client, auth(user_id), body, "running").status_code == 409
+
+    # One whose worker died is taken over and runs again
+    _stale_claim(user_id, "crashed", body, age=lease * 2)
+    assert _post_register(client, auth(user_id), body, "crashed").status_code == 201
+
+    replay = _post_register(client, auth(user_id), body, "crashed")
+    assert replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+
+
+def test_replay_restores_headers_set_by_the_view(app, client, auth, make_user, make_hackathon):
+    app.config["REGISTRATION_QUEUE_ENABLED"] = True
+    organizer, user_id = make_user("organizer"), make_user("participant")
+    hackathon_id = make_hackathon(organizer, "Queued event")
+    body = json.dumps({"hackathon_id": hackathon_id})
+
+    first = _post_register(client, auth(user_id), body, "queued")
+    assert first.status_code == 202
+    assert first.headers["Location"] == f"/register/tickets/{first.get_json()['id']}"
+
+    retry = _post_register(client, auth(user_id), body, "queued")
+    assert retry.status_code == 202
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.headers["Location"] == first.headers["Location"]
+    assert retry.headers.getlist("Content-Type") == ["application/json"]
+    assert retry.get_json() == first.get_json()
@@ -0,0 +1,259 @@
+import csv
+import io
+import json
+import threading
+from collections import Counter
+
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon
+from app.modules.registration.model import HackathonRegistration
+from app.modules.registration.services import RegistrationService
+from app.modules.registration.utils import registration_cache
+
+
+def test_parallel_registrations_never_oversell(app, client, auth, make_user, make_hackathon):
+    capacity, contenders = 5, 30
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Limited seats", max_participants=capacity)
+    users = [make_user(f"racer{i:02d}") for i in range(contenders)]
+
+    statuses = []
+    start = threading.Barrier(contenders)
+
+    def register(headers):
+        # One client per thread, all released at once like a registration-open burst
+        thread_client = app.test_client()
+        start.wait()
+        response = thread_client.post(
+            "/register/", json={"hackathon_id": hackathon_id}, headers=headers
+        )
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=register, args=(auth(user_id),)) for user_id in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert Counter(statuses) == {201: capacity, 409: contenders - capacity}
+
+    db.session.expire_all()
+    assert db.session.get(Hackathon, hackathon_id).seats_taken == capacity
+    assert HackathonRegistration.query.filter_by(hackathon_id=hackathon_id).count() == capacity
+
+
+def test_registration_refreshes_cached_public_view(client, auth, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Cached event", max_participants=10)
+
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["seats_taken"] == 0
+
+    participant = make_user("participant")
+    registered = client.post("/register/", json={"hackathon_id": hackathon_id}, headers=auth(participant))
+    assert registered.status_code == 201
+
+    anonymous = client.get(f"/hackathon/view/{hackathon_id}").get_json()
+    assert anonymous["seats_taken"] == 1
+    assert anonymous["participant_count"] == 1
+
+
+def test_queued_registration_rejects_unknown_team(app, client, auth, make_user, make_hackathon):
+    app.config["REGISTRATION_QUEUE_ENABLED"] = True
+    organizer, user_id = make_user("organizer"), make_user("participant")
+    hackathon_id = make_hackathon(
+        organizer, "Queued event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+
+    response = client.post(
+        "/register/", json={"hackathon_id": hackathon_id, "team_id": "no-such-team"}, headers=auth(user_id)
+    )
+
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "Team not found"
+
+
+def test_team_registration_check_query_count_is_constant(
+    client, auth, make_user, make_hackathon, make_team, count_queries
+):
+    organizer = make_user("organizer")
+
+    def check_queries(teams):
+        hackathon_id = make_hackathon(
+            organizer, f"Event of {teams}", participation_type="team", min_team_size=1, max_team_size=2
+        )
+        for i in range(teams):
+            owner, mate = make_user(f"owner{teams}x{i}"), make_user(f"mate{teams}x{i}")
+            team_id = make_team(owner, f"Team {teams}-{i}", [mate])
+            RegistrationService.register(hackathon_id, owner, team_id)
+
+        registration_cache.clear()
+        with count_queries() as counter:
+            response = client.get(f"/register/check/{hackathon_id}", headers=auth(mate))
+        assert response.get_json()["registered"] is True
+        return counter.count
+
+    assert check_queries(20) == check_queries(2)
+
+
+def test_organizer_listing_keeps_array_shape_unless_paged(client, auth, make_user, make_hackathon):
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Listed event")
+    for name in ("first", "second", "third"):
+        client.post("/register/", json={"hackathon_id": hackathon_id}, headers=auth(make_user(f"{name}user")))
+
+    listing = client.get(f"/register/hackathon/{hackathon_id}", headers=auth(organizer)).get_json()
+    assert isinstance(listing, list) and len(listing) == 3
+
+    page = client.get(f"/register/hackathon/{hackathon_id}?limit=0", headers=auth(organizer))
+    assert page.status_code == 200
+    assert page.get_json()["limit"] == 1
+    assert len(page.get_json()["results"]) == 1
+    assert page.get_json()["next_cursor"] is not None
+
+
+def test_rejected_team_stops_counting_participants(client, auth, make_user, make_hackathon, make_team):
+    organizer = make_user("organizer")
+    owner, mate = make_user("teamowner"), make_user("teammate")
+    hackathon_id = make_hackathon(
+        organizer, "Team event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+    team_id = make_team(owner, "Builders")
+    registration = RegistrationService.register(hackathon_id, owner, team_id)
+
+    RegistrationService.update_status(registration.id, "rejected")
+    # Member changes of a rejected team leave the event's counters alone
+    client.post(f"/team/{team_id}/members", json={"member_id": mate}, headers=auth(owner))
+
+    db.session.expire_all()
+    hackathon = db.session.get(Hackathon, hackathon_id)
+    assert (hackathon.participant_count, hackathon.seats_taken) == (0, 0)
+    assert RegistrationService.reconcile_participant_counts(fix=False) == {}
+    analytics = client.get(f"/register/analytics/{hackathon_id}", headers=auth(organizer)).get_json()
+    assert analytics["total_participants"] == 0
+
+    RegistrationService.update_status(registration.id, "approved")
+    db.session.expire_all()
+    hackathon = db.session.get(Hackathon, hackathon_id)
+    assert (hackathon.participant_count, hackathon.seats_taken) == (2, 2)
+    assert RegistrationService.reconcile_participant_counts(fix=False) == {}
+
+
+def test_stats_row_analytics_count_people_from_the_hackathon(app, client, auth, make_user, make_hackathon, make_team):
+    app.config["REGISTRATION_STATS_ENABLED"] = True
+    organizer = make_user("organizer")
+    owner, mate = make_user("teamowner"), make_user("teammate")
+    hackathon_id = make_hackathon(
+        organizer, "Team event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+    team_id = make_team(owner, "Builders")
+    RegistrationService.register(hackathon_id, owner, team_id)
+    # Joining after registration moves the count without touching the stats row
+    client.post(f"/team/{team_id}/members", json={"member_id": mate}, headers=auth(owner))
+
+    analytics = client.get(f"/register/analytics/{hackathon_id}", headers=auth(organizer)).get_json()
+    assert analytics["total_registrations"] == analytics["pending"] == 1
+    assert analytics["total_participants"] == 2
+
+
+def test_bulk_status_reports_an_outcome_per_id(client, auth, make_user, make_hackathon):
+    organizer, stranger = make_user("organizer"), make_user("otherorg")
+    hackathon_id = make_hackathon(organizer, "Two seats", max_participants=2)
+    foreign_id = make_hackathon(stranger, "Not mine")
+
+    rejected = RegistrationService.register(hackathon_id, make_user("rejected")).id
+    RegistrationService.update_status(rejected, "rejected")
+    pending = RegistrationService.register(hackathon_id, make_user("pending")).id
+    # Takes the seat the rejected registration gave back
+    RegistrationService.register(hackathon_id, make_user("latecomer"))
+    foreign = RegistrationService.register(foreign_id, make_user("elsewhere")).id
+
+    response = client.patch("/register/status", headers=auth(organizer), json={
+        "status": "approved",
+        "ids": [pending, rejected, "missing", foreign, pending],
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["updated"] == 1
+    assert {row["id"]: row["outcome"] for row in body["results"]} == {
+        pending: "updated",
+        rejected: "full",
+        "missing": "not_found",
+        foreign: "forbidden",
+    }
+
+    db.session.expire_all()
+    statuses = {
+        registration_id: db.session.get(HackathonRegistration, registration_id).status
+        for registration_id in (pending, rejected, foreign)
+    }
+    assert statuses == {pending: "approved", rejected: "rejected", foreign: "pending"}
+    assert db.session.get(Hackathon, hackathon_id).seats_taken == 2
+
+
+def test_export_streams_one_row_per_participant(client, auth, make_user, make_hackathon, make_team):
+    organizer = make_user("organizer")
+    owner, mate, solo = make_user("teamowner"), make_user("teammate"), make_user("soloist")
+    hackathon_id = make_hackathon(
+        organizer, "Team event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+    builders = RegistrationService.register(hackathon_id, owner, make_team(owner, "Builders", [mate])).id
+    RegistrationService.update_status(builders, "approved")
+    loners = RegistrationService.register(hackathon_id, solo, make_team(solo, "Loners")).id
+    url = f"/register/hackathon/{hackathon_id}/export"
+
+    response = client.get(url, headers=auth(organizer))
+    assert response.mimetype == "text/csv"
+    assert f'filename="registrations-{hackathon_id}.csv"' in response.headers["Content-Disposition"]
+    reader = csv.DictReader(io.StringIO(response.get_data(as_text=True)))
+    assert reader.fieldnames == [
+        "registration_id", "status", "registered_at", "team_id", "team_name",
+        "role", "user_id", "name", "email",
+    ]
+    assert [(row["registration_id"], row["team_name"], row["role"], row["email"]) for row in reader] == [
+        (builders, "Builders", "owner", "teamowner@example.com"),
+        (builders, "Builders", "member", "teammate@example.com"),
+        (loners, "Loners", "owner", "soloist@example.com"),
+    ]
+
+    response = client.get(f"{url}?format=ndjson&status=approved", headers=auth(organizer))
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [(row["user_id"], row["name"], row["status"]) for row in rows] == [
+        (owner, "teamowner", "approved"),
+        (mate, "teammate", "approved"),
+    ]
+
+    assert client.get(f"{url}?format=xml", headers=auth(organizer)).status_code == 400
+    assert client.get(url, headers=auth(owner)).status_code == 403
+
+
+def test_registration_map_follows_team_membership(client, auth, make_user, make_hackathon, make_team):
+    organizer = make_user("organizer")
+    owner, newcomer = make_user("teamowner"), make_user("newcomer")
+    team_event = make_hackathon(
+        organizer, "Team event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+    solo_event = make_hackathon(organizer, "Solo event")
+    team_id = make_team(owner, "Builders")
+    team_registration = RegistrationService.register(team_event, owner, team_id).id
+    solo_registration = RegistrationService.register(solo_event, owner).id
+
+    registrations = RegistrationService.get_registration_map(owner)
+    assert {hid: (entry["id"], entry["mode"]) for hid, entry in registrations.items()} == {
+        team_event: (team_registration, "team"),
+        solo_event: (solo_registration, "individual"),
+    }
+
+    def check():
+        return client.get(f"/register/check/{team_event}", headers=auth(newcomer)).get_json()
+
+    # Warms the newcomer's cached map with no registrations
+    assert check() == {"registered": False}
+    assert registration_cache.get(str(newcomer)) == {}
+
+    client.post(f"/team/{team_id}/members", json={"member_id": newcomer}, headers=auth(owner))
+    assert check()["registration_id"] == team_registration
+
+    client.delete(f"/team/{team_id}/members/{newcomer}", headers=auth(owner))
+    assert check() == {"registered": False}
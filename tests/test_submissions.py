@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from app.modules.submissions.services import ScoringService, SubmissionService
+
+
+def _submit(hackathon_id, team_id, title):
+    data = SimpleNamespace(
+        project_title=title, project_desc="A project", github_url="https://example.com", live_url=None
+    )
+    return SubmissionService.create_submission(hackathon_id, team_id, data).id
+
+
+def test_score_summary_and_ranking(make_user, make_hackathon, make_team):
+    organizer = make_user("organizer")
+    hackathon_id = make_hackathon(organizer, "Judged event")
+    other_event = make_hackathon(organizer, "Other event")
+    owners = [make_user(f"owner{i}") for i in range(4)]
+    teams = [make_team(owner, f"Team {i}") for i, owner in enumerate(owners)]
+
+    strong = _submit(hackathon_id, teams[0], "Strong")
+    close = _submit(hackathon_id, teams[1], "Close second")
+    unscored = _submit(hackathon_id, teams[2], "Unscored")
+    elsewhere = _submit(other_event, teams[3], "Elsewhere")
+
+    for judge, score in ((1, 90), (2, 81), (3, 70)):
+        ScoringService.submit_score(strong, judge, score)
+    ScoringService.submit_score(close, 1, 50)
+    # A judge re-scoring replaces their score instead of adding one
+    ScoringService.submit_score(close, 1, 80)
+    ScoringService.submit_score(elsewhere, 1, 100)
+
+    assert ScoringService.score_summary(hackathon_id=hackathon_id) == {
+        strong: {"average": 80.33, "count": 3, "min": 70, "max": 90},
+        close: {"average": 80.0, "count": 1, "min": 80, "max": 80},
+    }
+    assert set(ScoringService.score_summary(submission_ids=[close, elsewhere])) == {close, elsewhere}
+
+    ranked = ScoringService.rank_submissions(hackathon_id)
+    assert [(submission.id, average) for submission, average in ranked] == [
+        (strong, 80.33), (close, 80.0), (unscored, None)
+    ]
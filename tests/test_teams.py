@@ -0,0 +1,147 @@
+from app.extensions import db
+from app.modules.hackathons.models import Hackathon
+from app.modules.registration.model import HackathonRegistration
+from app.modules.registration.services import RegistrationService
+from app.modules.teams.models import HackathonTeam
+from app.modules.teams.utils import roster_cache
+
+
+def test_member_changes_refresh_cached_participant_count(
+    client, auth, make_user, make_hackathon, make_team
+):
+    organizer = make_user("organizer")
+    owner, newcomer = make_user("teamowner"), make_user("newcomer")
+    hackathon_id = make_hackathon(
+        organizer, "Team event", participation_type="team", min_team_size=1, max_team_size=4
+    )
+    team_id = make_team(owner, "Builders")
+    RegistrationService.register(hackathon_id, owner, team_id)
+
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["participant_count"] == 1
+
+    added = client.post(f"/team/{team_id}/members", json={"member_id": newcomer}, headers=auth(owner))
+    assert added.status_code == 201
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["participant_count"] == 2
+
+    removed = client.delete(f"/team/{team_id}/members/{newcomer}", headers=auth(owner))
+    assert removed.status_code == 200
+    assert client.get(f"/hackathon/view/{hackathon_id}").get_json()["participant_count"] == 1
+
+
+def test_my_teams_query_count_is_constant(client, auth, make_user, make_team, count_queries):
+    def cold_my_teams_queries(user_id):
+        roster_cache.clear()
+        with count_queries() as counter:
+            response = client.get("/team/my-teams", headers=auth(user_id))
+        assert response.status_code == 200
+        return counter.count, response.get_json()["results"]
+
+    mate = make_user("teammate")
+    solo, busy = make_user("soloist"), make_user("joiner")
+    make_team(solo, "Only team", [mate])
+    for i in range(20):
+        make_team(busy, f"Team {i:02d}", [mate])
+
+    one_team, solo_results = cold_my_teams_queries(solo)
+    twenty_teams, busy_results = cold_my_teams_queries(busy)
+
+    assert len(solo_results) == 1 and len(busy_results) == 20
+    assert all(len(team["members"]) == 2 for team in busy_results)
+    assert twenty_teams == one_team
+
+
+def _seats_taken(hackathon_id):
+    db.session.expire_all()
+    return db.session.get(Hackathon, hackathon_id).seats_taken
+
+
+def test_member_changes_move_seats_and_respect_capacity(
+    client, auth, make_user, make_hackathon, make_team
+):
+    organizer = make_user("organizer")
+    owner, mate, extra = make_user("teamowner"), make_user("teammate"), make_user("latecomer")
+    hackathon_id = make_hackathon(
+        organizer, "Small event", participation_type="team",
+        min_team_size=1, max_team_size=4, max_participants=2
+    )
+    team_id = make_team(owner, "Builders")
+    RegistrationService.register(hackathon_id, owner, team_id)
+    assert _seats_taken(hackathon_id) == 1
+
+    assert client.post(f"/team/{team_id}/members", json={"member_id": mate}, headers=auth(owner)).status_code == 201
+    assert _seats_taken(hackathon_id) == 2
+
+    # A third member would oversell the event
+    full = client.post(f"/team/{team_id}/members", json={"member_id": extra}, headers=auth(owner))
+    assert full.status_code == 409
+    assert _seats_taken(hackathon_id) == 2
+    assert client.get(f"/team/{team_id}", headers=auth(owner)).get_json()["members_count"] == 2
+
+    assert client.delete(f"/team/{team_id}/members/{mate}", headers=auth(owner)).status_code == 200
+    assert _seats_taken(hackathon_id) == 1
+    registration = HackathonRegistration.query.filter_by(team_id=team_id).one()
+    assert registration.seats == 1
+
+
+def test_batch_members_report_a_result_per_member(client, auth, make_user, make_team):
+    owner, leaving, staying = make_user("teamowner"), make_user("leaving"), make_user("staying")
+    first, second, torn = make_user("firstnew"), make_user("secondnew"), make_user("undecided")
+    outsider = make_user("outsider")
+    team_id = make_team(owner, "Builders", [leaving, staying])
+
+    response = client.post(f"/team/{team_id}/members/batch", headers=auth(owner), json={
+        "add": [
+            {"member_id": first},
+            {"member_id": second, "role": "coleader"},
+            {"member_id": staying},
+            {"member_id": 999999},
+            {"member_id": torn},
+        ],
+        "remove": [leaving, owner, outsider, torn],
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert {(r["action"], r["member_id"]): r["result"] for r in body["results"]} == {
+        ("add", first): "added",
+        ("add", second): "added",
+        ("add", staying): "already_member",
+        ("add", 999999): "user_not_found",
+        ("add", torn): "conflict",
+        ("remove", leaving): "removed",
+        ("remove", owner): "is_owner",
+        ("remove", outsider): "not_member",
+        ("remove", torn): "conflict",
+    }
+    # owner, leaving and staying, plus two added and one removed
+    assert body["member_count"] == 4
+
+    db.session.expire_all()
+    assert db.session.get(HackathonTeam, team_id).member_count == 4
+    team = client.get("/team/my-teams", headers=auth(owner)).get_json()["results"][0]
+    assert {m["member_id"]: m["role"] for m in team["members"]} == {
+        owner: "owner", staying: "member", first: "member", second: "coleader",
+    }
+
+
+def test_renames_and_role_changes_show_in_cached_my_teams(client, auth, make_user, make_team):
+    owner, mate, late = make_user("teamowner"), make_user("teammate"), make_user("latejoin")
+    team_id = make_team(owner, "Builders", [mate, late])
+
+    def roster():
+        team = client.get("/team/my-teams", headers=auth(owner)).get_json()["results"][0]
+        return [(m["member_id"], m["name"], m["role"]) for m in team["members"]]
+
+    # Members come back in join order
+    assert roster() == [
+        (owner, "teamowner", "owner"), (mate, "teammate", "member"), (late, "latejoin", "member")
+    ]
+
+    assert client.put("/auth/me", json={"name": "renamedmate"}, headers=auth(mate)).status_code == 200
+    assert roster()[1] == (mate, "renamedmate", "member")
+
+    response = client.put(
+        f"/team/{team_id}/members/{mate}/role", json={"role": "coleader"}, headers=auth(owner)
+    )
+    assert response.status_code == 200
+    assert roster()[1] == (mate, "renamedmate", "coleader")